@@ -1,10 +1,10 @@
 # backend/api.py
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
-from typing import List
+from fastapi.responses import ORJSONResponse, RedirectResponse, StreamingResponse
+from typing import List, Literal
 from pydantic import BaseModel
-from backend.src.news_utils import db_connection
+from backend.src.news_utils import db_connection, init_articles_fts
 from backend.src.models import MediaSource
 from datetime import datetime
 from backend.src.log_utils import api_logger, health_logger
@@ -14,15 +14,85 @@ import time
 import dateutil.tz
 import sqlite3
 import logging
-from fastapi import Query
-from pydantic import HttpUrl, Field, field_validator
+from fastapi import Query, Request, Response
+from pydantic import HttpUrl, Field, field_validator, TypeAdapter
 import re
+import functools
+import hashlib
+import itertools
+import threading
+import orjson
+import queue
+from contextlib import asynccontextmanager, contextmanager
 from backend.src.media_utils import get_all_media_sources
 
+
+# Pool of read connections shared by all requests in this worker. Every
+# endpoint is read-only, so connections are handed out freely and returned
+# after use, keeping each connection's page and statement caches warm.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 4))
+_POOL: queue.SimpleQueue = queue.SimpleQueue()
+
+
+def _pool_acquire() -> sqlite3.Connection:
+    """Take a connection from the pool, opening a new one if it is empty."""
+    try:
+        return _POOL.get_nowait()
+    except queue.Empty:
+        # Connections move between the event loop and threadpool threads
+        return db_connection(check_same_thread=False)
+
+
+def _pool_release(conn: sqlite3.Connection) -> None:
+    """Return a connection to the pool, closing it if the pool is full."""
+    if _POOL.qsize() < DB_POOL_SIZE:
+        _POOL.put(conn)
+    else:
+        conn.close()
+
+
+@contextmanager
+def _pool_get():
+    """Context manager yielding a pooled connection and returning it on exit."""
+    conn = _pool_acquire()
+    try:
+        yield conn
+    finally:
+        _pool_release(conn)
+
+
+def _close_pool() -> None:
+    """Close every idle pooled connection."""
+    while True:
+        try:
+            _POOL.get_nowait().close()
+        except queue.Empty:
+            return
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-open the connection pool at startup and close it at shutdown."""
+    # Keyword search queries articles_fts; make sure it exists even if the collector
+    # hasn't run init_database() against this database since the index was added
+    conn = db_connection()
+    try:
+        init_articles_fts(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    for _ in range(DB_POOL_SIZE):
+        _POOL.put(db_connection(check_same_thread=False))
+    yield
+    _close_pool()
+
+
 app = FastAPI(
     title="Concordia API",
     description="Harmony in the Noise: API for analyzing media bias and narratives",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Enable CORS to allow the frontend to access the API
@@ -55,42 +125,161 @@ class Article(BaseModel):
 
 
 class Analysis(BaseModel):
-    id: str
-    source_name: str
-    analysis_date: str
-    numbers_of_articles: int
-    main_narrative_theme_1: str | None
-    main_narrative_coverage_1: float
-    main_narrative_examples_1: str | None
-    main_narrative_theme_2: str | None
-    main_narrative_coverage_2: float
-    main_narrative_examples_2: str | None
-    main_narrative_theme_3: str | None
-    main_narrative_coverage_3: float
-    main_narrative_examples_3: str | None
-    main_narrative_theme_4: str | None
-    main_narrative_coverage_4: float
-    main_narrative_examples_4: str | None
-    main_narrative_theme_5: str | None
-    main_narrative_coverage_5: float
-    main_narrative_examples_5: str | None
-    main_narrative_confidence: float
-    sentiment_positive_percentage: float
-    sentiment_negative_percentage: float
-    sentiment_neutral_percentage: float
-    sentiment_confidence: float
-    bias_political_score: float
-    bias_political_leaning: str | None
-    bias_supporting_evidence: str | None
-    bias_confidence: float
-    values_promoted_value_1: str | None
-    values_promoted_examples_1: str | None
-    values_promoted_value_2: str | None
-    values_promoted_examples_2: str | None
-    values_promoted_value_3: str | None
-    values_promoted_examples_3: str | None
-    values_promoted_confidence: float
-    created_at: str
+    # Every field defaults to None because /analyses can return a projection
+    # of the columns (see the `fields` query parameter).
+    id: str | None = None
+    source_name: str | None = None
+    analysis_date: str | None = None
+    numbers_of_articles: int | None = None
+    main_narrative_theme_1: str | None = None
+    main_narrative_coverage_1: float | None = None
+    main_narrative_examples_1: str | None = None
+    main_narrative_theme_2: str | None = None
+    main_narrative_coverage_2: float | None = None
+    main_narrative_examples_2: str | None = None
+    main_narrative_theme_3: str | None = None
+    main_narrative_coverage_3: float | None = None
+    main_narrative_examples_3: str | None = None
+    main_narrative_theme_4: str | None = None
+    main_narrative_coverage_4: float | None = None
+    main_narrative_examples_4: str | None = None
+    main_narrative_theme_5: str | None = None
+    main_narrative_coverage_5: float | None = None
+    main_narrative_examples_5: str | None = None
+    main_narrative_confidence: float | None = None
+    sentiment_positive_percentage: float | None = None
+    sentiment_negative_percentage: float | None = None
+    sentiment_neutral_percentage: float | None = None
+    sentiment_confidence: float | None = None
+    bias_political_score: float | None = None
+    bias_political_leaning: str | None = None
+    bias_supporting_evidence: str | None = None
+    bias_confidence: float | None = None
+    values_promoted_value_1: str | None = None
+    values_promoted_examples_1: str | None = None
+    values_promoted_value_2: str | None = None
+    values_promoted_examples_2: str | None = None
+    values_promoted_value_3: str | None = None
+    values_promoted_examples_3: str | None = None
+    values_promoted_confidence: float | None = None
+    created_at: str | None = None
+
+
+# Columns exposed by /analyses, in table order. `source_name` comes from the
+# joined sources table; every other column lives on the analyses table.
+ANALYSIS_COLUMNS = tuple(Analysis.model_fields)
+ALLOWED_ANALYSIS_COLUMNS = frozenset(ANALYSIS_COLUMNS)
+
+
+def _analysis_column_sql(column: str, has_source: bool = False) -> str:
+    """
+    Map an /analyses output column to its SELECT expression.
+
+    When the request filters on a source the sources table isn't joined, so
+    `source_name` is bound as a parameter holding the requested name.
+    """
+    if column == "source_name":
+        return "? AS source_name" if has_source else "s.name AS source_name"
+    return f"a.{column}"
+
+
+def _analysis_select(columns: tuple[str, ...], has_source: bool) -> str:
+    """Build the /analyses SELECT list for the given columns."""
+    return ", ".join(_analysis_column_sql(c, has_source) for c in columns)
+
+
+# Precomputed SELECT lists for the default "all fields" request, keyed by
+# whether a source filter is present
+ANALYSIS_SELECT_ALL = {
+    has_source: _analysis_select(ANALYSIS_COLUMNS, has_source)
+    for has_source in (False, True)
+}
+
+
+def _parse_analysis_fields(fields: str) -> tuple[str, ...]:
+    """
+    Resolve a comma-separated `fields` query parameter into output columns.
+
+    Columns are validated against ALLOWED_ANALYSIS_COLUMNS and emitted in
+    table order, so duplicates and ordering in the request don't matter.
+
+    Raises:
+        HTTPException: 400 if the parameter is empty or names unknown columns.
+    """
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - ALLOWED_ANALYSIS_COLUMNS
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    if not requested:
+        raise HTTPException(status_code=400, detail="No fields requested.")
+    return tuple(c for c in ANALYSIS_COLUMNS if c in requested)
+
+
+@functools.lru_cache(maxsize=64)
+def _source_id_for_name(name: str) -> int:
+    """
+    Look up the source_id for a source name.
+
+    Results are cached for the life of the worker; source ids never change
+    once assigned.
+
+    Raises:
+        LookupError: If no source has that name. Misses aren't cached, so a
+            source added later by the collector is picked up on the next call.
+    """
+    with _pool_get() as conn:
+        row = conn.execute(
+            "SELECT source_id FROM sources WHERE name = ?", (name,)
+        ).fetchone()
+    if row is None:
+        raise LookupError(name)
+    return row["source_id"]
+
+
+def _resolve_source_id(name: str) -> int | None:
+    """Return the source_id for `name`, or None (which matches no rows) if unknown."""
+    try:
+        return _source_id_for_name(name)
+    except LookupError:
+        return None
+
+
+# ISO 'YYYY-MM-DD' date with a plausible month and day. Checked with
+# fullmatch() so a trailing newline isn't accepted the way '$' would allow.
+_DATE_RE = re.compile(r"\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])", re.ASCII)
+
+
+def _fts_phrase(keyword: str) -> str:
+    """
+    Quote a user-supplied keyword as an FTS5 prefix phrase query.
+
+    Quoting keeps FTS5 operators in the input from being interpreted, and the
+    trailing '*' lets partial words match (e.g., 'Ukrain' matches 'Ukraine').
+    """
+    return '"' + keyword.replace('"', '""') + '"*'
+
+
+# FTS5 drops punctuation (including '_') when tokenizing, so keywords containing
+# anything other than letters, digits and whitespace (e.g., 'c++', 'u.s.' or '$$')
+# would match too loosely or not at all; they are searched literally with GLOB instead.
+_NON_WORD_RE = re.compile(r"[^\w\s]|_")
+
+# Keywords with nothing to search for once whitespace and '_' are ignored
+_BLANK_KEYWORD_RE = re.compile(r"[\s_]*")
+
+
+def _glob_pattern(keyword: str) -> str:
+    """
+    Wrap a keyword as a GLOB substring pattern.
+
+    GLOB metacharacters in the keyword are bracketed so they match literally. The
+    query lower-cases both the pattern and the columns, so matching ignores case.
+    """
+    escaped = re.sub(r"([*?\[])", r"[\1]", keyword)
+    return f"*{escaped}*"
 
 
 # Root endpoint to redirect to API docs
@@ -102,172 +291,280 @@ async def root():
     return RedirectResponse(url="/docs")
 
 
+STREAM_BATCH_SIZE = 500  # rows fetched per fetchmany() call when streaming
+
+
+def _stream_query(query: str, params: list, columnar: bool = False) -> StreamingResponse:
+    """
+    Execute a query and stream its rows to the client as JSON.
+
+    The query runs before the response starts so SQL errors still surface as
+    a 500; rows are then pulled in STREAM_BATCH_SIZE batches with fetchmany()
+    and encoded with orjson, keeping memory at O(batch) instead of O(rows).
+    db_connection() sets sqlite3.Row as the row factory, so each row converts
+    straight to a dict keyed by its column names.
+
+    With `columnar=True` the column names are sent once and each row is a
+    plain array: {"columns": [...], "rows": [[...], ...]}.
+    """
+    conn = _pool_acquire()
+    try:
+        cursor = conn.cursor()
+        cursor.arraysize = STREAM_BATCH_SIZE
+        cursor.execute(query, params)
+    except Exception:
+        _pool_release(conn)
+        raise
+
+    if columnar:
+        columns = [column[0] for column in cursor.description]
+        head = b'{"columns":' + orjson.dumps(columns) + b',"rows":['
+        tail = b"]}"
+        encode_row = lambda row: orjson.dumps(tuple(row))
+    else:
+        head, tail = b"[", b"]"
+        encode_row = lambda row: orjson.dumps(dict(row))
+
+    def generate():
+        try:
+            yield head
+            separator = b""
+            while rows := cursor.fetchmany():
+                yield separator + b",".join(encode_row(row) for row in rows)
+                separator = b","
+            yield tail
+        finally:
+            cursor.close()
+            _pool_release(conn)
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+def _build_articles_query(
+    has_source: bool, has_date: bool, keyword_match: str | None
+) -> str:
+    """
+    Build the /articles SQL for one combination of optional filters.
+
+    A source filter is applied to the indexed a.source_id column and the
+    source name is bound back in as a parameter, so the sources join is only
+    needed when returning articles from every source.
+    """
+    if has_source:
+        query = """
+            SELECT a.id, ? AS source_name, a.raw_title, a.raw_description,
+                   a.clean_content, a.categories, a.link, a.publication_date, a.created_at
+            FROM articles a
+            WHERE a.source_id = ?
+        """
+    else:
+        query = """
+            SELECT a.id, s.name AS source_name, a.raw_title, a.raw_description,
+                   a.clean_content, a.categories, a.link, a.publication_date, a.created_at
+            FROM articles a
+            JOIN sources s ON a.source_id = s.source_id
+            WHERE 1=1
+        """
+    if has_date:
+        # Range over the stored 'YYYY-MM-DD HH:MM:SS' strings so the
+        # publication_date index can be used
+        query += " AND a.publication_date >= ? AND a.publication_date < date(?, '+1 day')"
+    if keyword_match == "fts":
+        query += " AND a.rowid IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)"
+    elif keyword_match == "glob":
+        # GLOB is case-sensitive, so fold both sides to match like the FTS path
+        query += " AND (lower(a.raw_title) GLOB lower(?) OR lower(a.clean_content) GLOB lower(?))"
+    return query
+
+
+# All 12 /articles query variants keyed by (has_source, has_date,
+# keyword_match), where keyword_match is None, "fts" or "glob".
+# Reusing identical SQL text also lets sqlite3's per-connection statement
+# cache hand back an already-prepared statement.
+_ARTICLES_QUERIES = {
+    flags: _build_articles_query(*flags)
+    for flags in itertools.product((False, True), (False, True), (None, "fts", "glob"))
+}
+
+
+def _build_analyses_query(select_list: str, has_source: bool, has_date: bool) -> str:
+    """
+    Build the /analyses SQL for a SELECT list and combination of optional filters.
+
+    As with /articles, a source filter runs on a.source_id without joining
+    sources; the SELECT list must then come from _analysis_select(..., True).
+    """
+    if has_source:
+        query = f"""
+            SELECT {select_list}
+            FROM analyses a
+            WHERE a.source_id = ?
+        """
+    else:
+        query = f"""
+            SELECT {select_list}
+            FROM analyses a
+            JOIN sources s ON a.source_id = s.source_id
+            WHERE 1=1
+        """
+    if has_date:
+        query += " AND a.analysis_date = ?"
+    return query
+
+
+# All 4 "all fields" /analyses query variants keyed by (has_source, has_date).
+# Projected requests (the `fields` parameter) are built per call.
+_ANALYSES_QUERIES = {
+    (has_source, has_date): _build_analyses_query(
+        ANALYSIS_SELECT_ALL[has_source], has_source, has_date
+    )
+    for has_source, has_date in itertools.product((False, True), repeat=2)
+}
+
+
 # API Endpoints
-@app.get("/articles", response_model=List[Article])
-async def get_articles(source: str | None = None, date: str | None = None, keyword: str | None = None):
+# Handlers that touch SQLite are plain `def` functions so FastAPI runs them
+# in its threadpool instead of blocking the event loop.
+# /articles and /analyses stream plain dicts serialized by orjson; the
+# models are attached as documented responses only, so FastAPI doesn't
+# re-validate every row.
+@app.get("/articles", responses={200: {"model": List[Article]}})
+def get_articles(source: str | None = None, date: str | None = None, keyword: str | None = None):
     """
     Retrieve articles from the database, optionally filtered by source, date, and keyword.
 
     Args:
         source (str, optional): Filter by source name (e.g., 'fox_news').
         date (str, optional): Filter by publication date (YYYY-MM-DD).
-        keyword (str, optional): Filter by keyword in article title or content.
+        keyword (str, optional): Filter by keyword in article title or content, ignoring case.
+            Surrounding whitespace is ignored, and a blank keyword applies no filter.
 
     Returns:
         List[Article]: A list of articles.
     """
-    query = """
-        SELECT a.id, s.name AS source_name, a.raw_title, a.raw_description, 
-               a.clean_content, a.categories, a.link, a.publication_date, a.created_at
-        FROM articles a
-        JOIN sources s ON a.source_id = s.source_id
-        WHERE 1=1
-    """
+    keyword_match = None
     params = []
     if source:
-        query += " AND s.name = ?"
-        params.append(source)
+        params.extend([source, _resolve_source_id(source)])
     if date:
-        query += " AND strftime('%Y-%m-%d', a.publication_date) = ?"
-        params.append(date)
+        params.extend([date, date])
+    if keyword is not None:
+        keyword = keyword.strip()
+        if _BLANK_KEYWORD_RE.fullmatch(keyword):
+            keyword = None
     if keyword:
-        query += " AND (a.raw_title LIKE ? OR a.clean_content LIKE ?)"
-        params.extend([f"%{keyword}%", f"%{keyword}%"])
+        if _NON_WORD_RE.search(keyword):
+            keyword_match = "glob"
+            pattern = _glob_pattern(keyword)
+            params.extend([pattern, pattern])
+        else:
+            keyword_match = "fts"
+            params.append(_fts_phrase(keyword))
+    query = _ARTICLES_QUERIES[(bool(source), bool(date), keyword_match)]
+    return _stream_query(query, params)
 
-    with db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        
-        articles = []
-        for row in rows:
-            article = {
-                "id": row[0],
-                "source_name": row[1],
-                "raw_title": row[2],
-                "raw_description": row[3],
-                "clean_content": row[4],
-                "categories": row[5],
-                "link": row[6],
-                "publication_date": row[7],
-                "created_at": row[8]
-            }
-            articles.append(article)
-        
-        return articles
-
-
-@app.get("/analyses", response_model=List[Analysis])
-async def get_analyses(source: str | None = None, date: str | None = None):
+
+@app.get("/analyses", responses={200: {"model": List[Analysis]}})
+def get_analyses(
+    source: str | None = None,
+    date: str | None = None,
+    fields: str | None = Query(None),
+    layout: Literal["rows", "columns"] = "rows",
+):
     """
     Retrieve analysis results from the database, optionally filtered by source and date.
 
     Args:
         source (str, optional): Filter by source name (e.g., 'fox_news').
         date (str, optional): Filter by analysis date in ISO format (e.g., '2025-03-03').
+        fields (str, optional): Comma-separated list of columns to return
+            (e.g., 'source_name,analysis_date,bias_political_score'). Defaults to all columns.
+        layout (str, optional): 'rows' (default) returns a list of objects; 'columns' returns
+            {"columns": [...], "rows": [[...], ...]} with each column name sent only once.
 
     Returns:
         List[Analysis]: A list of analysis results.
     """
-    query = """
-        SELECT a.id, s.name AS source_name, a.analysis_date, a.numbers_of_articles,
-               a.main_narrative_theme_1, a.main_narrative_coverage_1, a.main_narrative_examples_1,
-               a.main_narrative_theme_2, a.main_narrative_coverage_2, a.main_narrative_examples_2,
-               a.main_narrative_theme_3, a.main_narrative_coverage_3, a.main_narrative_examples_3,
-               a.main_narrative_theme_4, a.main_narrative_coverage_4, a.main_narrative_examples_4,
-               a.main_narrative_theme_5, a.main_narrative_coverage_5, a.main_narrative_examples_5,
-               a.main_narrative_confidence,
-               a.sentiment_positive_percentage, a.sentiment_negative_percentage, a.sentiment_neutral_percentage,
-               a.sentiment_confidence,
-               a.bias_political_score, a.bias_political_leaning, a.bias_supporting_evidence, a.bias_confidence,
-               a.values_promoted_value_1, a.values_promoted_examples_1,
-               a.values_promoted_value_2, a.values_promoted_examples_2,
-               a.values_promoted_value_3, a.values_promoted_examples_3,
-               a.values_promoted_confidence, a.created_at
-        FROM analyses a
-        JOIN sources s ON a.source_id = s.source_id
-        WHERE 1=1
-    """
+    # Ensure the date is in the correct format
+    if date and not _DATE_RE.fullmatch(date):
+        raise HTTPException(
+            status_code=400, detail="Invalid date format. Please use YYYY-MM-DD."
+        )
+
+    flags = (bool(source), bool(date))
+    if fields is None:
+        columns = ANALYSIS_COLUMNS
+        query = _ANALYSES_QUERIES[flags]
+    else:
+        columns = _parse_analysis_fields(fields)
+        query = _build_analyses_query(_analysis_select(columns, flags[0]), *flags)
+
     params = []
     if source:
-        query += " AND s.name = ?"
-        params.append(source)
+        # source_name is bound back in rather than joining sources
+        if "source_name" in columns:
+            params.append(source)
+        params.append(_resolve_source_id(source))
     if date:
-        # Ensure the date is in the correct format
-        try:
-            # This assumes the input date is in the format 'YYYY-MM-DD'
-            datetime.strptime(date, "%Y-%m-%d")
-            query += " AND a.analysis_date = ?"
-            params.append(date)
-        except ValueError:
-            raise HTTPException(
-                status_code=400, detail="Invalid date format. Please use YYYY-MM-DD."
-            )
+        params.append(date)
 
-    with db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        analyses = [
-            Analysis(
-                id=row["id"],
-                source_name=row["source_name"],
-                analysis_date=row["analysis_date"],
-                numbers_of_articles=row["numbers_of_articles"],
-                main_narrative_theme_1=row["main_narrative_theme_1"],
-                main_narrative_coverage_1=row["main_narrative_coverage_1"],
-                main_narrative_examples_1=row["main_narrative_examples_1"],
-                main_narrative_theme_2=row["main_narrative_theme_2"],
-                main_narrative_coverage_2=row["main_narrative_coverage_2"],
-                main_narrative_examples_2=row["main_narrative_examples_2"],
-                main_narrative_theme_3=row["main_narrative_theme_3"],
-                main_narrative_coverage_3=row["main_narrative_coverage_3"],
-                main_narrative_examples_3=row["main_narrative_examples_3"],
-                main_narrative_theme_4=row["main_narrative_theme_4"],
-                main_narrative_coverage_4=row["main_narrative_coverage_4"],
-                main_narrative_examples_4=row["main_narrative_examples_4"],
-                main_narrative_theme_5=row["main_narrative_theme_5"],
-                main_narrative_coverage_5=row["main_narrative_coverage_5"],
-                main_narrative_examples_5=row["main_narrative_examples_5"],
-                main_narrative_confidence=row["main_narrative_confidence"],
-                sentiment_positive_percentage=row["sentiment_positive_percentage"],
-                sentiment_negative_percentage=row["sentiment_negative_percentage"],
-                sentiment_neutral_percentage=row["sentiment_neutral_percentage"],
-                sentiment_confidence=row["sentiment_confidence"],
-                bias_political_score=row["bias_political_score"],
-                bias_political_leaning=row["bias_political_leaning"],
-                bias_supporting_evidence=row["bias_supporting_evidence"],
-                bias_confidence=row["bias_confidence"],
-                values_promoted_value_1=row["values_promoted_value_1"],
-                values_promoted_examples_1=row["values_promoted_examples_1"],
-                values_promoted_value_2=row["values_promoted_value_2"],
-                values_promoted_examples_2=row["values_promoted_examples_2"],
-                values_promoted_value_3=row["values_promoted_value_3"],
-                values_promoted_examples_3=row["values_promoted_examples_3"],
-                values_promoted_confidence=row["values_promoted_confidence"],
-                created_at=row["created_at"],
+    return _stream_query(query, params, columnar=layout == "columns")
+
+
+# In-process cache for /media_sources. The table only changes when bias
+# metadata is updated, so the serialized response is kept for a short TTL
+# and revalidated by clients through its ETag.
+MEDIA_SOURCES_CACHE_TTL = 300  # seconds
+_media_sources_adapter = TypeAdapter(List[MediaSource])
+_media_cache: dict = {}
+_media_cache_lock = threading.Lock()
+
+
+def _get_media_sources_payload() -> tuple[str, bytes]:
+    """
+    Return the (etag, json_bytes) pair for /media_sources, refreshing it from
+    the database when the cached entry is missing or expired.
+    """
+    with _media_cache_lock:
+        if _media_cache and _media_cache["expires_at"] > time.monotonic():
+            return _media_cache["etag"], _media_cache["body"]
+
+        media_sources = get_all_media_sources()
+        body = _media_sources_adapter.dump_json(media_sources)
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        api_logger.info(f"Successfully retrieved {len(media_sources)} media sources.")
+        # get_all_media_sources() returns [] on database errors; don't pin
+        # that result for a whole TTL.
+        if media_sources:
+            _media_cache.update(
+                etag=etag,
+                body=body,
+                expires_at=time.monotonic() + MEDIA_SOURCES_CACHE_TTL,
             )
-            for row in cursor.fetchall()
-        ]
-    return analyses
+        return etag, body
 
 
 @app.get("/media_sources", response_model=List[MediaSource])
-async def get_media_sources():
+def get_media_sources(request: Request):
     """
     Retrieve all media sources with their metadata and bias ratings.
 
     Fetches all records from the media_sources table and returns them
     as a list of MediaSource objects. Handles potential database errors.
+    Responses are cached in-process for MEDIA_SOURCES_CACHE_TTL seconds and
+    carry an ETag; a matching If-None-Match header yields 304 Not Modified.
     """
     # Log the request entry
     api_logger.info("Request received for /media_sources")
     try:
-        # Use the utility function to get all sources
-        media_sources = get_all_media_sources()
-        # Log successful retrieval
-        api_logger.info(f"Successfully retrieved {len(media_sources)} media sources.")
-        # Return the list of media sources
-        return media_sources
+        etag, body = _get_media_sources_payload()
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"max-age={MEDIA_SOURCES_CACHE_TTL}",
+        }
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
     except sqlite3.Error as e:
         # Log the database error
         api_logger.error(f"Database error in /media_sources: {e}", exc_info=True)
@@ -280,64 +577,85 @@ async def get_media_sources():
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
 
+# Log files reported by /health
+HEALTH_LOG_FILES = {
+    "collector": "logs/collector.log",
+    "analyzer": "logs/analyzer.log",
+    "api": "logs/api.log",
+    "maintenance": "logs/maintenance.log",
+    "health": "logs/health.log",
+    "resources": "logs/resources.log",
+}
+# Log files are created once and then only appended to or rotated in
+# place, so a positive existence check is remembered; missing files are
+# re-checked on every probe.
+_log_files_seen: set[str] = set()
+
+
+def _log_file_exists(path: str) -> bool:
+    """Return whether a log file exists, skipping the stat() once it has been seen."""
+    if path in _log_files_seen:
+        return True
+    if os.path.exists(path):
+        _log_files_seen.add(path)
+        return True
+    return False
+
+
+# Process handle for /health, created once. The first cpu_percent() call
+# only seeds the baseline, so later calls report usage since the last probe
+# without sleeping.
+_PROCESS = psutil.Process(os.getpid())
+_PROCESS.cpu_percent(interval=None)
+_PROCESS_CREATE_TIME = _PROCESS.create_time()
+
+
 @app.get("/health")
-async def health_check():
+def health_check():
     """
     Health check endpoint that returns the status of all components.
     """
     health_logger.info("Health check requested")
     
-    # Check database connection
+    # Check database connection, then fetch the last collection and analysis
+    # times in a single statement on the same connection
     db_status = "healthy"
     db_message = "Database connection successful"
+    last_collection = "unknown"
+    last_analysis = "unknown"
     try:
-        with db_connection() as conn:
+        with _pool_get() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT 1")
+            try:
+                cursor.execute(
+                    """
+                    SELECT (SELECT MAX(created_at) FROM articles) AS last_article,
+                           (SELECT MAX(created_at) FROM analyses) AS last_analysis
+                    """
+                )
+                result = cursor.fetchone()
+                last_collection = result["last_article"] or "unknown"
+                last_analysis = result["last_analysis"] or "unknown"
+            except Exception as e:
+                health_logger.error(f"Error checking last activity times: {str(e)}")
     except Exception as e:
         db_status = "unhealthy"
         db_message = f"Database connection failed: {str(e)}"
         health_logger.error(db_message)
     
     # Check log files
-    log_files = {
-        "collector": os.path.exists("logs/collector.log"),
-        "analyzer": os.path.exists("logs/analyzer.log"),
-        "api": os.path.exists("logs/api.log"),
-        "maintenance": os.path.exists("logs/maintenance.log"),
-        "health": os.path.exists("logs/health.log"),
-        "resources": os.path.exists("logs/resources.log")
-    }
+    log_files = {name: _log_file_exists(path) for name, path in HEALTH_LOG_FILES.items()}
     
-    # Check system resources
-    process = psutil.Process(os.getpid())
-    memory_info = process.memory_info()
+    # Check system resources (non-blocking: CPU usage since the previous call)
+    memory_info = _PROCESS.memory_info()
     
     resources = {
-        "cpu_percent": process.cpu_percent(interval=0.1),
+        "cpu_percent": _PROCESS.cpu_percent(interval=None),
         "memory_usage_mb": memory_info.rss / (1024 * 1024),
-        "uptime_seconds": time.time() - process.create_time()
+        "uptime_seconds": time.time() - _PROCESS_CREATE_TIME
     }
     
-    # Check last collection and analysis times
-    last_collection = "unknown"
-    last_analysis = "unknown"
-    
-    try:
-        with db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT MAX(created_at) FROM articles")
-            result = cursor.fetchone()
-            if result and result[0]:
-                last_collection = result[0]
-                
-            cursor.execute("SELECT MAX(created_at) FROM analyses")
-            result = cursor.fetchone()
-            if result and result[0]:
-                last_analysis = result[0]
-    except Exception as e:
-        health_logger.error(f"Error checking last activity times: {str(e)}")
-    
     health_status = {
         "status": "healthy" if db_status == "healthy" else "unhealthy",
         "database": {
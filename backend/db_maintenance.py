@@ -2,30 +2,28 @@
 """
 Database maintenance scheduler for optimizing the SQLite database.
 
-This module uses the `schedule` library to periodically run a VACUUM operation on `news_analysis.db`
-to reclaim space and improve performance, scheduled weekly on Sundays at midnight UTC. It ensures
-cost efficiency (no additional costs beyond minimal CPU/disk), reliability with error logging, and
-no fabricated data, printing progress with emojis (e.g., 🚀, 🛠️). Logs INFO messages to
-`logs/db_maintenance.log`.
+This module runs a quick optimization (incremental vacuum, ANALYZE, PRAGMA optimize, WAL checkpoint) on
+`news_analysis.db` once at startup and then daily at 03:30 local time, sleeping with asyncio
+until each run is due instead of polling. It ensures cost efficiency (no additional costs beyond
+minimal CPU/disk), reliability with error logging, and no fabricated data, printing progress with
+emojis (e.g., 🚀, 🛠️). Logs INFO messages to `logs/db_maintenance.log`.
 
 Dependencies:
-    - schedule: For task scheduling.
-    - src.news_utils: For the vacuum_database function.
+    - asyncio: For sleeping until the next scheduled run.
+    - src.news_utils: For the db_connection helper.
     - logging: For tracking operations.
 
 Usage:
     >>> python db_maintenance.py
     🚀 Starting database maintenance scheduler...
-    🛠️ Successfully vacuumed database at 2025-02-24 03:00:00
-    # Runs continuously, vacuuming weekly, stopping with Ctrl+C (⏹️ Database maintenance scheduler stopped by user)
+    ✅ Quick database optimization completed at 2025-02-24 03:30:00
+    # Runs continuously, optimizing daily, stopping with Ctrl+C (⏹️ Database maintenance scheduler stopped by user)
 """
 
-import schedule
-import time
+import asyncio
 import logging
-import sqlite3
-from backend.src.news_utils import vacuum_database
-from datetime import datetime
+from backend.src.news_utils import db_connection
+from datetime import datetime, time, timedelta
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, filename="logs/db_maintenance.log")
@@ -38,7 +36,7 @@ def quick_optimize_database(db_path: str = "news_analysis.db"):
         logger.info("Starting quick database optimization...")
         print("🔄 Starting quick database optimization...")
         
-        with sqlite3.connect(db_path) as conn:
+        with db_connection(db_path) as conn:
             # Use incremental vacuum instead of full vacuum
             print("🧹 Running incremental vacuum...")
             conn.execute("PRAGMA incremental_vacuum")
@@ -50,10 +48,12 @@ def quick_optimize_database(db_path: str = "news_analysis.db"):
             # Run SQLite's built-in optimizer
             print("⚙️ Running PRAGMA optimize...")
             conn.execute("PRAGMA optimize")
-            
-            # Ensure WAL is checkpointed (synced to main database file)
+
+            # SQLite's automatic checkpoints are PASSIVE: they never shrink the WAL file
+            # and can't complete while the API's pooled readers hold old snapshots, so
+            # checkpoint fully here and truncate the WAL back to zero bytes
             print("💾 Running WAL checkpoint...")
-            conn.execute("PRAGMA wal_checkpoint(FULL)")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
         
         success_message = f"✅ Quick database optimization completed at {datetime.now()}"
         logger.info(success_message)
@@ -64,21 +64,36 @@ def quick_optimize_database(db_path: str = "news_analysis.db"):
         print(error_message)
 
 
+# Local time of day at which the daily optimization runs
+MAINTENANCE_TIME = time(3, 30)
+
+
+def seconds_until_next_run(now: datetime | None = None) -> float:
+    """Return the number of seconds from `now` until the next MAINTENANCE_TIME."""
+    now = now or datetime.now()
+    next_run = datetime.combine(now.date(), MAINTENANCE_TIME)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+async def run_scheduler() -> None:
+    """Sleep until each scheduled run is due, then optimize the database."""
+    while True:
+        await asyncio.sleep(seconds_until_next_run())
+        quick_optimize_database()
+
+
 if __name__ == "__main__":
     # Just run the optimization directly and exit
     quick_optimize_database()
     
-    # Or set up a schedule for regular optimization
-    schedule.every().day.at("03:30").do(quick_optimize_database)
-    
     print("🚀 Starting database maintenance scheduler...")
     logger.info("🚀 Starting database maintenance scheduler")
 
-    # Run the scheduler continuously, checking every 60 seconds
+    # Run the scheduler continuously, waking only when a run is due
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)
+        asyncio.run(run_scheduler())
     except KeyboardInterrupt:
         stop_message = "⏹️ Database maintenance scheduler stopped by user"
         logger.info(stop_message)
@@ -10,6 +10,7 @@ inter-source and chunk delays, cost efficiency (x chars/article), and no fabrica
 
 Dependencies:
     - feedparser: For RSS parsing.
+    - requests: For fetching feeds over a shared keep-alive session.
     - dateutil: For date validation.
     - tenacity: For retry logic on network errors.
     - src.utils: For HTTP headers and logging.
@@ -23,35 +24,111 @@ Usage:
 """
 
 import feedparser
+import requests
+from requests.adapters import HTTPAdapter
 import dateutil.parser
 from datetime import datetime, timedelta
+import calendar
+import functools
+import hashlib
+import json
 import logging
+from logging.handlers import RotatingFileHandler
+import os
+import pickle
 import time
-import random
 import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.error import URLError
+from urllib.parse import urlparse
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
     retry_if_exception_type,
     before_sleep_log,
 )
-from backend.src.news_utils import get_random_headers, unify_date_format
+from backend.src.news_utils import (
+    TokenBucket,
+    get_random_headers,
+    parse_date,
+    unify_date_format,
+)
 import yaml
 
+# libyaml's C loader when available, otherwise the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 retry_logger = logging.getLogger("retry")
 retry_logger.setLevel(logging.WARNING)
 
+# Shared by every parser so keep-alive connections (and their TLS sessions)
+# are reused across feeds on the same host. Retries are handled by tenacity.
+HTTP_SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+# Last body and validators (ETag / Last-Modified) per feed URL, so unchanged
+# feeds can be revalidated with a conditional GET. Lives under data/, which
+# is mounted as a volume in docker-compose.
+FEED_CACHE_DIR = os.getenv("FEED_CACHE_DIR", "data/feed_cache")
+
+
+# One bucket per host, shared by every parser in the process
+_HOST_BUCKETS = {}
+_HOST_BUCKETS_LOCK = threading.Lock()
+
+
+def _feed_cache_paths(url):
+    """Return the (metadata, body, parsed feed) cache file paths for a feed URL."""
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    base = os.path.join(FEED_CACHE_DIR, key)
+    return f"{base}.json", f"{base}.xml", f"{base}.pkl"
+
+
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(second):
+    """Formats a Unix timestamp (whole seconds) as local 'YYYY-MM-DD HH:MM:SS'."""
+    return datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def now_str():
+    """
+    Returns the current local time as 'YYYY-MM-DD HH:MM:SS'.
+
+    Used as the publication date fallback for entries without a usable date. The
+    string only changes once a second, so a run of such entries formats it once.
+
+    Returns:
+        str: The formatted current time.
+    """
+    return _format_timestamp(int(time.time()))
+
+
+
+def tag_term_and_scheme(tag):
+    """
+    Returns a feed tag's (term, scheme) pair, with "" and None standing in for missing keys.
+
+    Shared by the parsers that pick categories out of entry tags by their scheme.
+    """
+    return tag.get("term") or "", tag.get("scheme")
 
 class BaseParser:
+    # Overridden by each subclass; names the logger and logs/<source_name>_errors.log
+    source_name = "base"
+
     def __init__(self, feeds):
         """
         Initializes a base parser for fetching and parsing RSS feeds from news sources.
 
-        Sets up the parser with a dictionary of feed URLs, source name, and delay parameters for
-        rate limiting. Configures logging for errors to a source-specific log file and tracks the
-        last fetch time for rate limiting.
+        Sets up the parser with a dictionary of feed URLs and delay parameters for rate limiting,
+        and configures logging for errors to a source-specific log file. Subclasses set
+        `source_name` as a class attribute so it is known before the logger is created.
 
         Args:
             feeds (dict): A dictionary mapping feed names to URLs (e.g., {'world': 'http://example.com/rss'}).
@@ -59,24 +136,43 @@ class BaseParser:
         Attributes:
             feeds (dict): Feed URLs for parsing.
             articles (list): List to store parsed articles.
-            source_name (str): Name of the news source (default 'base', overridden by subclasses).
+            source_name (str): Name of the news source (class attribute, 'base' unless overridden).
             MIN_DELAY (int): Minimum delay between fetches (default 1 second).
-            MAX_DELAY (int): Maximum delay between fetches (default 5 seconds).
-            last_fetch_time (float): Timestamp of the last fetch for rate limiting.
+            MAX_DELAY (int): Maximum delay between fetches (default 5 seconds). The per-host
+                rate limit allows one fetch per (MIN_DELAY + MAX_DELAY) / 2 seconds on average.
+            BURST (int): Fetches allowed back to back to one host before rate limiting (default 2).
+            MAX_WORKERS (int): Maximum number of feeds fetched concurrently (default 8).
             lookback_hours (int): Number of hours to look back for article collection.
         """
         self.feeds = feeds
         self.articles = []
-        self.source_name = "base"
         self.MIN_DELAY = 1
         self.MAX_DELAY = 5
-        self.last_fetch_time = 0
+        self.BURST = 2
+        self.MAX_WORKERS = 8
         self.lookback_hours = self._load_time_settings()
+        # Reference times fixed for the duration of run(); see start_time_window()
+        self._now = None
+        self._cutoff = None
+        self._cutoff_ts = None
+        self._yesterday_date = None
+        # Per-feed article dicts with the constant fields filled in; see article_template()
+        self._article_templates = {}
 
-        logging.basicConfig(
-            filename=f"logs/{self.source_name}_errors.log", level=logging.ERROR
-        )
         self.logger = logging.getLogger(self.source_name)
+        if not self.logger.handlers:
+            # One rotating error log per source, attached to the (process-wide) logger
+            # on first use only, so later instances reuse the same handler
+            os.makedirs("logs", exist_ok=True)
+            handler = RotatingFileHandler(
+                f"logs/{self.source_name}_errors.log",
+                maxBytes=5_000_000,
+                backupCount=3,
+                delay=True,
+            )
+            handler.setLevel(logging.ERROR)
+            handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+            self.logger.addHandler(handler)
 
     def is_yesterday(self, publication_date: str) -> bool:
         """
@@ -98,11 +194,13 @@ class BaseParser:
             True  # If today is Feb 24, 2025
         """
         try:
-            pub_date = dateutil.parser.parse(publication_date).astimezone(
+            pub_date = parse_date(publication_date).astimezone(
                 dateutil.tz.UTC
             )
-            yesterday = datetime.now(dateutil.tz.UTC) - timedelta(days=1)
-            return pub_date.date() == yesterday.date()
+            yesterday_date = self._yesterday_date
+            if yesterday_date is None:
+                yesterday_date = (datetime.now(dateutil.tz.UTC) - timedelta(days=1)).date()
+            return pub_date.date() == yesterday_date
         except Exception as e:
             self.logger.error(f"Date parsing error: {publication_date} - {str(e)}")
             return False
@@ -125,11 +223,7 @@ class BaseParser:
             >>> parser.extract_categories(entry)
             ['world', 'politics']
         """
-        return [
-            tag.term
-            for tag in entry.get("tags", [])
-            if hasattr(tag, "term") and tag.term
-        ]
+        return [tag.get("term") for tag in entry.get("tags", []) if tag.get("term")]
 
     def validate_entry(self, entry):
         """
@@ -179,22 +273,201 @@ class BaseParser:
              'published': 'Sun, 23 Feb 2025 14:58:00 GMT', 'publication_date': '2025-02-23 14:58:00',
              'categories': [], 'source': 'base', 'feed_url': 'http://bbc.com/rss'}
         """
-        return {
-            "title": entry.get("title", ""),
-            "description": entry.get("description", ""),
-            "link": entry.link,
-            "published": entry.get("published", ""),
-            "publication_date": unify_date_format(entry.get("published", "")),
-            "categories": self.extract_categories(entry),
-            "source": self.source_name,
-            "feed_url": rss_feed_url,
+        published = entry.get("published", "")
+        article = self.article_template(rss_feed_url).copy()
+        article["title"] = entry.get("title", "")
+        article["description"] = entry.get("description", "")
+        article["link"] = entry.get("link", "")
+        article["published"] = published
+        article["publication_date"] = unify_date_format(published)
+        article["categories"] = self.extract_categories(entry)
+        return article
+
+    def article_template(self, rss_feed_url: str) -> dict:
+        """
+        Returns the article dict template for a feed, with 'source' and 'feed_url' filled in.
+
+        parse_entry copies the template and sets the per-entry fields, which is cheaper
+        than building a fresh 8-key dict for every entry. Templates are created once
+        per feed URL and must not be modified by callers.
+
+        Args:
+            rss_feed_url (str): The URL of the RSS feed.
+
+        Returns:
+            dict: The shared template for that feed.
+        """
+        template = self._article_templates.get(rss_feed_url)
+        if template is None:
+            template = self._article_templates[rss_feed_url] = {
+                "title": "",
+                "description": "",
+                "link": "",
+                "published": "",
+                "publication_date": "",
+                "categories": None,
+                "source": self.source_name,
+                "feed_url": rss_feed_url,
+            }
+        return template
+
+    def load_cached_feed(self, url):
+        """
+        Loads the cached validators and body for a feed URL.
+
+        Args:
+            url (str): The feed URL.
+
+        Returns:
+            tuple[dict, bytes] | None: The metadata ('etag', 'modified', 'content_type')
+            and raw body, or None if nothing usable is cached.
+        """
+        meta_path, body_path, _ = _feed_cache_paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+            with open(body_path, "rb") as file:
+                return meta, file.read()
+        except (OSError, ValueError):
+            return None
+
+    def store_cached_feed(self, url, response):
+        """
+        Caches a feed response that carries an ETag or Last-Modified validator.
+
+        Files are written to a temporary name and renamed so a concurrent or
+        interrupted run never sees a half-written entry.
+
+        Args:
+            url (str): The feed URL.
+            response (requests.Response): A successful (200) response for the feed.
+        """
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type", ""),
         }
+        if not meta["etag"] and not meta["modified"]:
+            return
+        meta_path, body_path, _ = _feed_cache_paths(url)
+        try:
+            os.makedirs(FEED_CACHE_DIR, exist_ok=True)
+            with open(f"{body_path}.tmp", "wb") as file:
+                file.write(response.content)
+            os.replace(f"{body_path}.tmp", body_path)
+            with open(f"{meta_path}.tmp", "w", encoding="utf-8") as file:
+                json.dump(meta, file)
+            os.replace(f"{meta_path}.tmp", meta_path)
+        except OSError as e:
+            self.logger.error(f"Failed to cache feed {url}: {str(e)}")
+
+    def invalidate_cached_feed(self, url):
+        """Removes any cached entry for a feed URL (e.g., after a parsing error)."""
+        for path in _feed_cache_paths(url):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def parse_feed(self, url, body, response_headers=None):
+        """
+        Parses a feed body with feedparser, reusing the last parse if the body is unchanged.
+
+        The parsed FeedParserDict is pickled next to the feed's cached body together
+        with the SHA-256 of the body it came from, so an unchanged feed (e.g., after a
+        304 Not Modified) skips XML parsing entirely. Only one parse is kept per URL,
+        and feeds with parsing errors are never cached.
+
+        Args:
+            url (str): The feed URL, used as the cache key.
+            body (bytes | str): The raw feed document.
+            response_headers (dict, optional): HTTP headers passed through to feedparser.
+
+        Returns:
+            feedparser.FeedParserDict: The parsed feed.
+        """
+        raw = body.encode("utf-8") if isinstance(body, str) else body
+        digest = hashlib.sha256(raw).hexdigest()
+        parsed_path = _feed_cache_paths(url)[2]
+        try:
+            with open(parsed_path, "rb") as file:
+                cached_digest, feed = pickle.load(file)
+            if cached_digest == digest:
+                return feed
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # A corrupt or stale pickle (e.g., written by an older feedparser) is a
+            # cache miss; remove it so a bozo parse below can't leave it in place
+            self.logger.warning(f"Discarding unreadable parsed feed cache for {url}: {str(e)}")
+            try:
+                os.remove(parsed_path)
+            except OSError:
+                pass
+
+        # Descriptions are stripped to plain text by clean_article, so skip
+        # feedparser's pass that rewrites relative links inside entry HTML
+        feed = feedparser.parse(
+            body, response_headers=response_headers, resolve_relative_uris=False
+        )
+        if not feed.bozo:
+            try:
+                os.makedirs(FEED_CACHE_DIR, exist_ok=True)
+                with open(f"{parsed_path}.tmp", "wb") as file:
+                    pickle.dump((digest, feed), file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(f"{parsed_path}.tmp", parsed_path)
+            except (OSError, pickle.PicklingError) as e:
+                self.logger.error(f"Failed to cache parsed feed {url}: {str(e)}")
+        return feed
+
+    def download_feed(self, url):
+        """
+        Downloads a feed body, revalidating any cached copy with a conditional GET.
+
+        Sends If-None-Match / If-Modified-Since when the feed is cached; on a
+        304 Not Modified the cached body is returned instead of downloading it again.
+
+        Args:
+            url (str): The URL of the RSS feed to fetch.
+
+        Returns:
+            tuple[bytes, dict]: The raw feed body and the response headers relevant to parsing.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails or returns an HTTP error status.
+        """
+        headers = get_random_headers()
+        cached = self.load_cached_feed(url)
+        if cached:
+            meta, _ = cached
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("modified"):
+                headers["If-Modified-Since"] = meta["modified"]
+
+        response = HTTP_SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        if response.status_code == 304 and cached:
+            meta, body = cached
+            self.logger.info(f"Feed not modified, using cached copy: {url}")
+            return body, {"content-type": meta.get("content_type", "")}
+
+        response.raise_for_status()
+        self.store_cached_feed(url, response)
+        return response.content, dict(response.headers)
 
     @retry(
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=4, max=30),
+        # Random jitter keeps feeds that fail together from retrying in lockstep
+        wait=wait_exponential(multiplier=1, min=4, max=30) + wait_random(0, 4),
         retry=retry_if_exception_type(
-            (TimeoutError, socket.gaierror, URLError, ConnectionResetError)
+            (
+                TimeoutError,
+                socket.gaierror,
+                URLError,
+                ConnectionResetError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            )
         ),
         before_sleep=before_sleep_log(retry_logger, logging.WARNING),
         reraise=True,
@@ -203,9 +476,12 @@ class BaseParser:
         """
         Fetches and parses an RSS feed with retry logic for network errors.
 
-        Uses feedparser to retrieve and parse an RSS feed, applying random delays and
-        random headers to avoid rate limiting. Retries up to X times on network errors,
-        logging warnings for retries and errors for failures.
+        Downloads the feed over the shared HTTP_SESSION (revalidating a cached copy when
+        one exists, see download_feed) and parses it with feedparser, applying random
+        delays and random headers to avoid rate limiting. Makes up to 5 attempts in total on
+        network errors (timeouts, DNS/connection failures and resets, including the requests
+        ConnectionError/Timeout raised by the session), backing off exponentially with random
+        jitter, and logs warnings for retries and errors for failures.
 
         Args:
             url (str): The URL of the RSS feed to fetch.
@@ -218,6 +494,7 @@ class BaseParser:
             socket.gaierror: If the host is unreachable.
             URLError: If the URL is invalid or inaccessible.
             ConnectionResetError: If the connection is unexpectedly closed.
+            requests.exceptions.RequestException: If the request fails or returns an HTTP error status.
 
         Example:
             >>> parser = BaseParser({'world': 'http://bbc.com/rss'})
@@ -226,18 +503,15 @@ class BaseParser:
             10
         """
         try:
-            elapsed = time.time() - self.last_fetch_time
-            delay = random.uniform(self.MIN_DELAY, self.MAX_DELAY)
+            self.wait_for_host(url)
 
-            if elapsed < delay:
-                time.sleep(delay - elapsed)
-
-            headers = get_random_headers()
-            feed = feedparser.parse(url, request_headers=headers)
-            self.last_fetch_time = time.time()
+            body, response_headers = self.download_feed(url)
+            # Pass the response headers so feedparser can honour the declared charset
+            feed = self.parse_feed(url, body, response_headers)
 
             if feed.bozo:
                 self.logger.error(f"Feed parsing error: {feed.bozo_exception}")
+                self.invalidate_cached_feed(url)
                 raise feed.bozo_exception
 
             return feed
@@ -246,12 +520,103 @@ class BaseParser:
             self.logger.error(f"Fetch failed: {str(e)}")
             raise
 
+    def wait_for_host(self, url):
+        """
+        Waits for a token from the URL's host bucket before fetching.
+
+        Buckets are keyed by host and shared across parsers, so feeds fetched
+        concurrently from one host are spaced out while other hosts proceed
+        independently. A new bucket takes its rate from this parser's delays.
+
+        Args:
+            url (str): The URL about to be fetched.
+        """
+        host = urlparse(url).netloc
+        with _HOST_BUCKETS_LOCK:
+            bucket = _HOST_BUCKETS.get(host)
+            if bucket is None:
+                rate = 2 / (self.MIN_DELAY + self.MAX_DELAY)
+                bucket = _HOST_BUCKETS[host] = TokenBucket(rate, self.BURST)
+        bucket.acquire()
+
+    def process_feed(self, feed_name, url):
+        """
+        Fetches one feed and returns its valid articles within the time window.
+
+        Called from worker threads by iter_articles(); subclasses override this rather
+        than run() to customize per-feed handling.
+
+        Args:
+            feed_name (str): The feed's name from the configuration (e.g., 'world').
+            url (str): The URL of the RSS feed.
+
+        Returns:
+            list[dict]: Parsed article dictionaries from this feed.
+        """
+        articles = []
+        feed = self.fetch_feed(url)
+        # Bound once per feed rather than looked up on every entry
+        append = articles.append
+        validate = self.validate_entry
+        in_window = self.entry_within_time_window
+        parse = self.parse_entry
+        for entry in feed.entries:
+            # Most entries in a feed are older than the window; the date check is
+            # cheap with published_parsed, so it runs before validation
+            if in_window(entry) and validate(entry):
+                append(parse(entry, url))
+        return articles
+
+    def iter_articles(self):
+        """
+        Yields articles from all configured feeds as they become available.
+
+        Fetches and processes the feeds concurrently (up to MAX_WORKERS at a time),
+        filtering for articles within the time window and validating entries. Articles
+        are yielded in feed order as soon as each feed is done, keeping only the first
+        article for each link, so consumers can start on early feeds while later ones
+        are still downloading. Logs errors for failed feeds.
+
+        Yields:
+            dict: Parsed article dictionaries.
+
+        Example:
+            >>> parser = BaseParser({'world': 'http://bbc.com/rss'})
+            >>> for article in parser.iter_articles():
+            ...     print(article['title'])
+        """
+        if not self.feeds:
+            return
+        self.start_time_window()
+        # Feeds of one source often overlap; keep the first article per link
+        seen = set()
+        executor = ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(self.feeds)))
+        try:
+            futures = {
+                feed_name: executor.submit(self.process_feed, feed_name, url)
+                for feed_name, url in self.feeds.items()
+            }
+            # Consumed in submission order so the article order stays stable
+            for feed_name, future in futures.items():
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to process {feed_name}: {str(e)}")
+                    continue
+                for article in articles:
+                    if article["link"] not in seen:
+                        seen.add(article["link"])
+                        yield article
+        finally:
+            # Don't start feeds nobody will read if the consumer stopped early
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._now = self._cutoff = self._cutoff_ts = self._yesterday_date = None
+
     def run(self):
         """
         Executes the RSS feed parsing process for all configured feeds.
 
-        Fetches and processes each feed, filtering for yesterday's articles, validating
-        entries, and storing them in the `articles` list. Logs errors for failed feeds.
+        Collects everything from iter_articles() into the `articles` list.
 
         Returns:
             None: Updates `self.articles` with parsed articles.
@@ -261,19 +626,20 @@ class BaseParser:
             >>> parser.run()
             # Populates parser.articles with yesterday's BBC articles
         """
-        self.articles = []
-        for feed_name, url in self.feeds.items():
-            try:
-                feed = self.fetch_feed(url)
-                for entry in feed.entries:
-                    if not self.validate_entry(entry):
-                        continue
-                    if self.is_within_time_window(entry.get("published", "")):
-                        article = self.parse_entry(entry, url)
-                        self.articles.append(article)
-            except Exception as e:
-                self.logger.error(f"Failed to process {feed_name}: {str(e)}")
-                continue
+        self.articles = list(self.iter_articles())
+
+    def start_time_window(self):
+        """
+        Fixes the reference times used by the date filters for one run.
+
+        Every entry in a run is compared against the same `now`, so the cutoff
+        and yesterday's date are computed once here rather than per entry.
+        """
+        self._now = datetime.now(dateutil.tz.UTC)
+        self._cutoff = self._now - timedelta(hours=self.lookback_hours)
+        # As a Unix timestamp for comparing against feedparser's struct_time dates
+        self._cutoff_ts = self._cutoff.timestamp()
+        self._yesterday_date = (self._now - timedelta(days=1)).date()
 
     def parse(self):
         """
@@ -287,21 +653,58 @@ class BaseParser:
         """
         return self.articles
 
-    def _load_time_settings(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_time_settings():
         """
         Load time settings from configuration file.
+
+        The file is read once per process and shared by every parser instance.
         
         Returns:
             int: Number of hours to look back for article collection (default 20 if config not found).
         """
         try:
             with open("config/time_settings.yaml", "r") as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=_YAML_LOADER)
                 return config.get("collection", {}).get("lookback_hours", 20)
         except (FileNotFoundError, yaml.YAMLError):
             # Return default value if config file is missing or invalid
             return 20
 
+    def _cutoff_time(self):
+        """Return the collection cutoff (now - lookback_hours), fixed per run when set by run()."""
+        if self._cutoff is not None:
+            return self._cutoff
+        return datetime.now(dateutil.tz.UTC) - timedelta(hours=self.lookback_hours)
+
+    def entry_within_time_window(self, entry):
+        """
+        Check if a feed entry was published within the configured time window.
+
+        Uses the UTC `published_parsed` struct_time feedparser already produced when it
+        is available, and only parses the raw `published` string otherwise. Entries
+        without a date are skipped before any parsing, since there is nothing to store
+        as their publication date.
+
+        Args:
+            entry (feedparser.FeedParserDict): An RSS entry object from feedparser.
+
+        Returns:
+            bool: True if the entry is within the time window, False otherwise.
+        """
+        published_parsed = entry.get("published_parsed")
+        if published_parsed is not None:
+            cutoff_ts = self._cutoff_ts
+            if cutoff_ts is None:
+                cutoff_ts = self._cutoff_time().timestamp()
+            return calendar.timegm(published_parsed) >= cutoff_ts
+        published = entry.get("published")
+        if not published:
+            self.logger.debug(f"Skipping undated entry: {entry.get('link', 'Unknown')}")
+            return False
+        return self.is_within_time_window(published)
+
     def is_within_time_window(self, date_str):
         """
         Check if a date string is within the configured time window from now.
@@ -317,7 +720,7 @@ class BaseParser:
         """
         try:
             # Parse the date string
-            article_date = dateutil.parser.parse(date_str)
+            article_date = parse_date(date_str)
             
             # Ensure the article date is timezone-aware (convert to UTC if not)
             if article_date.tzinfo is None:
@@ -325,14 +728,8 @@ class BaseParser:
             else:
                 article_date = article_date.astimezone(dateutil.tz.UTC)
             
-            # Get current time in UTC
-            now = datetime.now(dateutil.tz.UTC)
-            
-            # Calculate the cutoff time (now - lookback_hours)
-            cutoff_time = now - timedelta(hours=self.lookback_hours)
-            
             # Check if the article date is after the cutoff time
-            return article_date >= cutoff_time
+            return article_date >= self._cutoff_time()
         except Exception as e:
             self.logger.error(f"Date parsing error: {str(e)} for date {date_str}")
             return False
@@ -23,6 +23,8 @@ from backend.parsers.base_parser import BaseParser
 
 
 class BBCParser(BaseParser):
+    source_name = "bbc"
+
     def __init__(self, feeds):
         """
         Initializes a parser specifically for BBC RSS feeds.
@@ -39,7 +41,6 @@ class BBCParser(BaseParser):
             # Initializes a parser for BBC news
         """
         super().__init__(feeds)  # Pass feeds to base class
-        self.source_name = "bbc"  # Explicit source name
 
     def extract_categories(self, entry):
         """
@@ -60,7 +61,7 @@ class BBCParser(BaseParser):
             >>> parser.extract_categories(entry)
             ['world', 'politics']
         """
-        return [tag.term for tag in entry.get("tags", []) if hasattr(tag, "term")]
+        return [tag.get("term") for tag in entry.get("tags", []) if tag.get("term")]
 
     def parse(self):
         """
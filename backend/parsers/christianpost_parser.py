@@ -16,10 +16,11 @@ Usage:
     # Collects articles, logging errors to logs/christian_post_errors.log
 """
 
-import logging
 from backend.parsers.base_parser import BaseParser
 
 class ChristianPostParser(BaseParser):
+    source_name = "christian_post"
+
     def __init__(self, feeds):
         """
         Initializes a parser for The Christian Post RSS feeds.
@@ -28,9 +29,7 @@ class ChristianPostParser(BaseParser):
             feeds (dict): A dictionary mapping feed names to URLs.
         """
         super().__init__(feeds)
-        self.source_name = "christian_post"
-        self.logger = logging.getLogger(self.source_name)
-        self.logger.info(f"Initialized ChristianPostParser with {len(feeds)} feed(s).")
+        self.logger.info("Initialized ChristianPostParser with %d feed(s).", len(feeds))
 
     # No overrides needed for standard RSS structure.
 
@@ -12,7 +12,8 @@ Dependencies:
     - feedparser: For RSS parsing.
 """
 
-from backend.parsers.base_parser import BaseParser
+from backend.parsers.base_parser import BaseParser, now_str
+from backend.src.news_utils import parse_date
 from datetime import datetime
 import dateutil
 
@@ -21,10 +22,12 @@ class DWParser(BaseParser):
     """Parser for Deutsche Welle (DW) RSS feeds.
 
     Extends BaseParser to handle DW's RDF RSS 1.0 feeds, specifically extracting
-    categories from <dc:subject> tags. Overrides run to handle publication dates
+    categories from <dc:subject> tags. Overrides process_feed to handle publication dates
     using 'updated' as a fallback due to feedparser's mapping of <dc:date>.
     """
 
+    source_name = "dw"
+
     def __init__(self, feeds):
         """
         Initializes the DWParser with feed URLs and sets the source name.
@@ -33,7 +36,6 @@ class DWParser(BaseParser):
             feeds (dict): A dictionary mapping feed names to URLs (e.g., {'general': 'https://rss.dw.com/rdf/rss-en-all'}).
         """
         super().__init__(feeds)
-        self.source_name = "dw"
 
     def extract_categories(self, entry):
         """
@@ -51,95 +53,112 @@ class DWParser(BaseParser):
             return [entry.dc_subject]
         return [tag.get("term") for tag in entry.get("tags", []) if tag.get("term")]
 
-    def run(self):
+    def process_feed(self, feed_name, url):
         """
-        Executes the RSS feed parsing process for DW feeds.
+        Fetches and processes one DW feed, applying validation and date filtering.
 
-        Fetches and processes each feed, applying validation and date filtering.
         Uses 'updated' as a fallback for publication date due to feedparser's mapping behavior.
 
+        Args:
+            feed_name (str): The feed's name from the configuration (e.g., 'general').
+            url (str): The URL of the RSS feed.
+
         Returns:
-            None: Updates `self.articles` with parsed articles.
+            list[dict]: Parsed article dictionaries from this feed.
         """
-        self.articles = []
-        current_date = datetime.now(dateutil.tz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-        for feed_name, url in self.feeds.items():
-            try:
-                feed = self.fetch_feed(url)
+        articles = []
+        now = self._now or datetime.now(dateutil.tz.UTC)
+        current_date = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+        feed = self.fetch_feed(url)
+        self.logger.info(
+            f"Fetched {len(feed.entries)} entries from {feed_name} feed ({url})"
+        )
+        # Bound once per feed rather than looked up on every entry
+        append = articles.append
+        validate = self.validate_entry
+        in_window = self.is_within_time_window
+        parse = self.parse_entry
+        for entry in feed.entries:
+            if not validate(entry):
                 self.logger.info(
-                    f"Fetched {len(feed.entries)} entries from {feed_name} feed ({url})"
+                    f"Skipped entry in {feed_name}: Invalid entry - {entry.get('title', 'Unknown')}"
+                )
+                continue
+
+            # Use 'updated' as the publication date since <dc:date> is mapped there
+            published_date = entry.get(
+                "published", entry.get("updated", current_date)
+            )
+            parsed_date = None
+            if published_date == current_date:
+                self.logger.warning(
+                    f"Missing publication date for entry in {feed_name}, using current date: {entry.get('title', 'Unknown')}"
                 )
-                for entry in feed.entries:
-                    if not self.validate_entry(entry):
-                        self.logger.info(
-                            f"Skipped entry in {feed_name}: Invalid entry - {entry.get('title', 'Unknown')}"
-                        )
-                        continue
-
-                    # Use 'updated' as the publication date since <dc:date> is mapped there
-                    published_date = entry.get(
-                        "published", entry.get("updated", current_date)
+            else:
+                try:
+                    parsed_date = parse_date(published_date)
+                    published_date = parsed_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+                    entry["published"] = published_date
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to parse date in {feed_name}: {published_date} - {str(e)} - {entry.get('title', 'Unknown')}"
                     )
-                    if published_date == current_date:
-                        self.logger.warning(
-                            f"Missing publication date for entry in {feed_name}, using current date: {entry.get('title', 'Unknown')}"
-                        )
-                    else:
-                        try:
-                            parsed_date = dateutil.parser.parse(published_date)
-                            published_date = parsed_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-                            entry["published"] = published_date
-                        except Exception as e:
-                            self.logger.error(
-                                f"Failed to parse date in {feed_name}: {published_date} - {str(e)} - {entry.get('title', 'Unknown')}"
-                            )
-                            entry["published"] = current_date
-                            published_date = current_date
-
-                    if not self.is_within_time_window(published_date):
-                        self.logger.info(
-                            f"Skipped entry in {feed_name}: Not within time window (published: {published_date}) - {entry.get('title', 'Unknown')}"
-                        )
-                        continue
-
-                    article = self.parse_entry(entry, url)
-                    self.articles.append(article)
-            except Exception as e:
-                self.logger.error(f"Failed to process {feed_name}: {str(e)}")
+                    entry["published"] = current_date
+                    published_date = current_date
+                    parsed_date = None
+
+            if not in_window(published_date):
+                self.logger.info(
+                    f"Skipped entry in {feed_name}: Not within time window (published: {published_date}) - {entry.get('title', 'Unknown')}"
+                )
                 continue
+
+            append(parse(entry, url, pub_dt=parsed_date))
+        return articles
+
+    def run(self):
+        """
+        Executes the RSS feed parsing process for DW feeds.
+
+        Returns:
+            None: Updates `self.articles` with parsed articles.
+        """
+        super().run()
         self.logger.info(
             f"Collected {len(self.articles)} articles for DW after filtering"
         )
 
-    def parse_entry(self, entry, rss_feed_url: str):
+    def parse_entry(self, entry, rss_feed_url: str, pub_dt: datetime | None = None):
         """
         Parses an RSS feed entry into a standardized article dictionary.
 
         Args:
             entry (feedparser.FeedParserDict): An RSS entry object from feedparser.
             rss_feed_url (str): The URL of the RSS feed the entry came from.
+            pub_dt (datetime, optional): The already-parsed publication date, if the caller
+                has one; skips parsing `entry["published"]` again.
 
         Returns:
             dict: A dictionary representing the article.
         """
         published_date = entry.get("published", "")
-        unified_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        if published_date:
+        if pub_dt is None and published_date:
             try:
-                parsed_date = dateutil.parser.parse(published_date)
-                unified_date = parsed_date.strftime("%Y-%m-%d %H:%M:%S")
+                pub_dt = parse_date(published_date)
             except Exception as e:
                 self.logger.error(
                     f"Failed to parse published date for {entry.get('title', 'Unknown')}: {published_date} - {str(e)}"
                 )
-
-        return {
-            "title": entry.get("title", ""),
-            "description": entry.get("description", ""),
-            "link": entry.link,
-            "published": published_date,
-            "publication_date": unified_date,
-            "categories": self.extract_categories(entry),
-            "source": self.source_name,
-            "feed_url": rss_feed_url,
-        }
+        if pub_dt is not None:
+            unified_date = pub_dt.strftime("%Y-%m-%d %H:%M:%S")
+        else:
+            unified_date = now_str()
+
+        article = self.article_template(rss_feed_url).copy()
+        article["title"] = entry.get("title", "")
+        article["description"] = entry.get("description", "")
+        article["link"] = entry.get("link", "")
+        article["published"] = published_date
+        article["publication_date"] = unified_date
+        article["categories"] = self.extract_categories(entry)
+        return article
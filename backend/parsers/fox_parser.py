@@ -19,10 +19,12 @@ Usage:
     # Collects yesterday's Fox News articles, logging errors to logs/fox_news_errors.log
 """
 
-from backend.parsers.base_parser import BaseParser
+from backend.parsers.base_parser import BaseParser, tag_term_and_scheme
 
 
 class FoxParser(BaseParser):
+    source_name = "fox_news"
+
     def __init__(self, feeds):
         """
         Initializes a parser specifically for Fox News RSS feeds.
@@ -41,7 +43,6 @@ class FoxParser(BaseParser):
             # Initializes a parser for Fox News political news
         """
         super().__init__(feeds)  # Pass feeds to base class
-        self.source_name = "fox_news"  # Explicit source name
 
     def extract_categories(self, entry):
         """
@@ -64,26 +65,7 @@ class FoxParser(BaseParser):
             ['politics']
         """
         return [
-            tag.term.split("/")[-1]
-            for tag in entry.get("tags", [])
-            if hasattr(tag, "scheme") and "taxonomy" in tag.scheme
+            term.rpartition("/")[2]
+            for term, scheme in map(tag_term_and_scheme, entry.get("tags", ()))
+            if scheme and "taxonomy" in scheme
         ]
-
-    def parse(self):
-        """
-        Parses RSS feed entries into a list of standardized article dictionaries.
-
-        Processes the RSS feed entries stored in `self.articles` after `run()`, returning
-        a list of dictionaries with keys like 'title', 'description', 'pub_date', 'link', and 'categories'.
-
-        Returns:
-            list[dict]: List of article dictionaries for use in collection.
-
-        Example:
-            >>> parser = FoxParser({'politics': 'http://foxnews.com/rss'})
-            >>> parser.run()
-            >>> articles = parser.parse()
-            >>> print(articles[0]['title'])
-            'Ukraine Conflict'
-        """
-        return self.articles
@@ -8,12 +8,29 @@ Logs errors to 'logs/france24_errors.log'.
 
 Dependencies:
     - parsers.base_parser: Base class for RSS parsing.
-    - dateutil: For date parsing and handling.
+    - src.news_utils: For date parsing (parse_date).
 """
 
-from backend.parsers.base_parser import BaseParser
-from datetime import datetime
-import dateutil
+from backend.parsers.base_parser import BaseParser, now_str
+from backend.src.news_utils import parse_date
+import functools
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_published(published_date: str) -> str:
+    """
+    Formats a France24 'published' string as 'YYYY-MM-DD HH:MM:SS'.
+
+    Entries in the same feed often share a timestamp, so results are cached. Parse
+    failures raise and are not cached.
+
+    Args:
+        published_date (str): The raw 'published' value from the entry.
+
+    Returns:
+        str: The formatted date.
+    """
+    return parse_date(published_date).strftime("%Y-%m-%d %H:%M:%S")
 
 
 class France24Parser(BaseParser):
@@ -23,6 +40,8 @@ class France24Parser(BaseParser):
     categories from the 'category' element and handling France24's date format.
     """
 
+    source_name = "france"
+
     def __init__(self, feeds):
         """
         Initializes the France24Parser with feed URLs and sets the source name.
@@ -31,7 +50,6 @@ class France24Parser(BaseParser):
             feeds (dict): A dictionary mapping feed names to URLs.
         """
         super().__init__(feeds)
-        self.source_name = "france"
 
     def extract_categories(self, entry):
         """
@@ -46,8 +64,8 @@ class France24Parser(BaseParser):
             list: A list of category strings.
         """
         # France24 uses the 'category' element for categories
-        if hasattr(entry, "category") and entry.category:
-            return [entry.category]
+        if category := entry.get("category"):
+            return [category]
         # Fallback to tags if category is not available
         return super().extract_categories(entry)
 
@@ -62,31 +80,28 @@ class France24Parser(BaseParser):
         Returns:
             dict: A dictionary representing the article.
         """
-        # Get the source from the dc:creator element if available
-        source_name = entry.get("dc_creator", "FRANCE 24")
-        
-        # Extract description and clean it
-        description = entry.get("description", "").strip()
-        
-        # Extract the publication date
+        title = entry.get("title", "")
+        link = entry.link
+        categories = self.extract_categories(entry)
         published_date = entry.get("published", "")
-        unified_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        unified_date = None
         if published_date:
             try:
-                parsed_date = dateutil.parser.parse(published_date)
-                unified_date = parsed_date.strftime("%Y-%m-%d %H:%M:%S")
+                unified_date = _format_published(published_date)
             except Exception as e:
                 self.logger.error(
                     f"Failed to parse published date for {entry.get('title', 'Unknown')}: {published_date} - {str(e)}"
                 )
-
-        return {
-            "title": entry.get("title", ""),
-            "description": description,
-            "link": entry.link,
-            "published": published_date,
-            "publication_date": unified_date,
-            "categories": self.extract_categories(entry),
-            "source": self.source_name,
-            "feed_url": rss_feed_url,
-        } 
\ No newline at end of file
+        if unified_date is None:
+            # Only entries without a usable date need the current time
+            unified_date = now_str()
+
+        article = self.article_template(rss_feed_url).copy()
+        article["title"] = title
+        article["description"] = entry.get("description", "").strip()
+        article["link"] = link
+        article["published"] = published_date
+        article["publication_date"] = unified_date
+        article["categories"] = categories
+        return article
@@ -19,10 +19,11 @@ Usage:
 """
 
 from backend.parsers.base_parser import BaseParser
-import logging
 
 
 class FTParser(BaseParser):
+    source_name = "financial_times"
+
     def __init__(self, feeds):
         """
         Initializes a parser specifically for Financial Times RSS feeds.
@@ -41,31 +42,8 @@ class FTParser(BaseParser):
             # Initializes a parser for FT world news
         """
         super().__init__(feeds)  # Pass feeds to base class
-        self.source_name = "financial_times"  # Explicit source name
-
-        # Configure a specific logger for this parser
-        # (BaseParser currently creates a generic logger based on self.source_name, which is sufficient)
-        self.logger = logging.getLogger(self.source_name)
-        self.logger.info(f"Initialized FTParser with {len(feeds)} feeds.")
+        self.logger.info("Initialized FTParser with %d feeds.", len(feeds))
 
     # No need to override extract_categories or parse_entry as base implementation is suitable.
-    # No need to override run as the base one handles fetching and filtering.
-
-    def parse(self):
-        """
-        Returns the list of parsed articles collected by run().
-
-        This method is called by rss_collector.py to retrieve articles after run().
-        It simply returns the articles accumulated by the base class's run method.
-
-        Returns:
-            list[dict]: List of article dictionaries populated by run().
-
-        Example:
-            >>> parser = FTParser({'world': 'https://www.ft.com/world?format=rss'})
-            >>> parser.run()
-            >>> articles = parser.parse()
-            >>> if articles: print(articles[0]['title'])
-        """
-        self.logger.info(f"Parsing complete. Returning {len(self.articles)} articles for {self.source_name}.")
-        return self.articles 
\ No newline at end of file
+    # No need to override run or parse as the base ones handle fetching, filtering
+    # and returning the collected articles.
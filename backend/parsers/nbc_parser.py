@@ -19,10 +19,12 @@ Usage:
     # Collects yesterday's NBC articles, logging errors to logs/nbc_errors.log
 """
 
-from backend.parsers.base_parser import BaseParser
+from backend.parsers.base_parser import BaseParser, tag_term_and_scheme
 
 
 class NBCParser(BaseParser):
+    source_name = "nbc"
+
     def __init__(self, feeds):
         """
         Initializes a parser specifically for NBC RSS feeds.
@@ -40,7 +42,6 @@ class NBCParser(BaseParser):
             # Initializes a parser for NBC news
         """
         super().__init__(feeds)
-        self.source_name = "nbc"
 
     def extract_categories(self, entry):
         """
@@ -63,26 +64,7 @@ class NBCParser(BaseParser):
             ['politics']
         """
         return [
-            tag.term.split("/")[-1]
-            for tag in entry.get("tags", [])
-            if hasattr(tag, "scheme") and "category" in tag.scheme
+            term.rpartition("/")[2]
+            for term, scheme in map(tag_term_and_scheme, entry.get("tags", ()))
+            if scheme and "category" in scheme
         ]
-
-    def parse(self):
-        """
-        Parses RSS feed entries into a list of standardized article dictionaries.
-
-        Processes the RSS feed entries stored in `self.articles` after `run()`, returning
-        a list of dictionaries with keys like 'title', 'description', 'pub_date', 'link', and 'categories'.
-
-        Returns:
-            list[dict]: List of article dictionaries for use in collection.
-
-        Example:
-            >>> parser = NBCParser({'news': 'http://nbcnews.com/rss'})
-            >>> parser.run()
-            >>> articles = parser.parse()
-            >>> print(articles[0]['title'])
-            'Ukraine Conflict'
-        """
-        return self.articles
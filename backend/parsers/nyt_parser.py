@@ -19,10 +19,11 @@ Usage:
 """
 
 from backend.parsers.base_parser import BaseParser
-import logging
 
 
 class NYTParser(BaseParser):
+    source_name = "new_york_times"
+
     def __init__(self, feeds):
         """
         Initializes a parser specifically for New York Times RSS feeds.
@@ -41,12 +42,7 @@ class NYTParser(BaseParser):
             # Initializes a parser for NYT homepage news
         """
         super().__init__(feeds)  # Pass feeds to base class
-        self.source_name = "new_york_times"  # Explicit source name
-        
-        # Configure a specific logger for this parser if not already handled by BaseParser setup
-        # (BaseParser currently creates a generic logger based on self.source_name, which is sufficient)
-        self.logger = logging.getLogger(self.source_name) 
-        self.logger.info(f"Initialized NYTParser with {len(feeds)} feeds.")
+        self.logger.info("Initialized NYTParser with %d feeds.", len(feeds))
 
     # No need to override extract_categories if the base implementation works.
     # The base implementation extracts 'term' from entry.tags, which feedparser
@@ -54,23 +50,5 @@ class NYTParser(BaseParser):
 
     # No need to override parse_entry as the base one handles standard fields.
 
-    # No need to override run as the base one handles fetching and filtering.
-
-    def parse(self):
-        """
-        Returns the list of parsed articles collected by run().
-
-        This method is called by rss_collector.py to retrieve articles after run().
-        It simply returns the articles accumulated by the base class's run method.
-
-        Returns:
-            list[dict]: List of article dictionaries populated by run().
-
-        Example:
-            >>> parser = NYTParser({'homepage': 'https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml'})
-            >>> parser.run()
-            >>> articles = parser.parse()
-            >>> if articles: print(articles[0]['title'])
-        """
-        self.logger.info(f"Parsing complete. Returning {len(self.articles)} articles for {self.source_name}.")
-        return self.articles 
\ No newline at end of file
+    # No need to override run or parse as the base ones handle fetching, filtering
+    # and returning the collected articles.
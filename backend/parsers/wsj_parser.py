@@ -19,10 +19,11 @@ Usage:
 """
 
 from backend.parsers.base_parser import BaseParser
-import logging
 
 
 class WSJParser(BaseParser):
+    source_name = "wsj"
+
     def __init__(self, feeds):
         """
         Initializes a parser specifically for Wall Street Journal RSS feeds.
@@ -41,35 +42,12 @@ class WSJParser(BaseParser):
             # Initializes a parser for WSJ opinion news
         """
         super().__init__(feeds)  # Pass feeds to base class
-        self.source_name = "wsj"  # Explicit source name
-
-        # Configure a specific logger for this parser
-        # BaseParser handles log file creation based on source_name
-        self.logger = logging.getLogger(self.source_name)
-        self.logger.info(f"Initialized WSJParser with {len(feeds)} feeds.")
+        self.logger.info("Initialized WSJParser with %d feeds.", len(feeds))
 
     # No need to override extract_categories if the base implementation works.
     # WSJ feed uses standard <pubDate>, <title>, <description> elements.
 
     # No need to override parse_entry as the base one handles standard fields.
 
-    # No need to override run as the base one handles fetching and filtering.
-
-    def parse(self):
-        """
-        Returns the list of parsed articles collected by run().
-
-        This method is called by rss_collector.py to retrieve articles after run().
-        It simply returns the articles accumulated by the base class's run method.
-
-        Returns:
-            list[dict]: List of article dictionaries populated by run().
-
-        Example:
-            >>> parser = WSJParser({'opinion': 'https://feeds.content.dowjones.io/public/rss/RSSOpinion'})
-            >>> parser.run()
-            >>> articles = parser.parse()
-            >>> if articles: print(articles[0]['title'])
-        """
-        self.logger.info(f"Parsing complete. Returning {len(self.articles)} articles for {self.source_name}.")
-        return self.articles 
\ No newline at end of file
+    # No need to override run or parse as the base ones handle fetching, filtering
+    # and returning the collected articles.
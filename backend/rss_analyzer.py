@@ -4,8 +4,8 @@ RSS analyzer for processing news articles and generating AI-based reports.
 
 This module queries articles from yesterday in `news_analysis.db` (adjusted for local system time
 assuming UTC for date filtering), analyzes them using the DeepSeek API via `AIAnalyzer`,
-and stores results in the database. It ensures cost efficiency, reliability with inter-source
-delays, logs progress and errors robustly, and continues processing even if one source fails AI analysis.
+and stores results in the database. It ensures cost efficiency, reliability with rate-limited
+concurrent source analyses, logs progress and errors robustly, and continues processing even if one source fails AI analysis.
 Prints progress with emojis (e.g., 🚀, ✅) and logs INFO/ERROR to `logs/analyzer.log`.
 
 Dependencies:
@@ -23,19 +23,27 @@ Usage:
     (Logs progress and errors to console and logs/analyzer.log)
 """
 
+import functools
 import hashlib
 import logging
 import os
 import sqlite3
-import time
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List
+from itertools import groupby
+from logging.handlers import MemoryHandler
+from operator import itemgetter
+from typing import Tuple
 
 import dateutil.tz # Correct import for timezone
 import yaml
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -44,7 +52,7 @@ from tenacity import (
 )
 
 from backend.src.ai_processor import AIAnalyzer
-from backend.src.news_utils import db_connection
+from backend.src.news_utils import TokenBucket, db_connection
 
 load_dotenv()
 
@@ -54,7 +62,7 @@ log_dir = "logs"
 os.makedirs(log_dir, exist_ok=True)
 log_file_path = os.path.join(log_dir, "analyzer.log")
 
-# Use a file handler
+# Use a file handler (written to through memory_handler below)
 file_handler = logging.FileHandler(log_file_path)
 file_handler.setLevel(logging.INFO)
 # Use a stream handler for console output (optional, print statements also used)
@@ -66,41 +74,123 @@ formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datef
 file_handler.setFormatter(formatter)
 # stream_handler.setFormatter(formatter) # If using stream handler
 
+# Buffer records in memory and write them to the file in batches; ERROR and above
+# flush immediately so failures are on disk right away. logging.shutdown() at exit
+# closes this handler before file_handler, flushing whatever is left.
+memory_handler = MemoryHandler(
+    capacity=1024, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+)
+
 # Get root logger and add handlers
 # Avoid adding handlers multiple times if script is re-run/imported
 logger = logging.getLogger(__name__)
 if not logger.handlers:
     logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
+    logger.addHandler(memory_handler)
     # logger.addHandler(stream_handler) # If using stream handler
     # logger.propagate = False # Allow propagation so pytest caplog can capture messages
 
 
-def load_parsers(config_path: str = "config/parsers.yaml") -> List[str]:
+# Columns written for each analysis, in the order values are built in analyze_articles
+_ANALYSIS_INSERT_COLUMNS = (
+    "id", "source_id", "analysis_date", "numbers_of_articles",
+    "main_narrative_theme_1", "main_narrative_coverage_1", "main_narrative_examples_1",
+    "main_narrative_theme_2", "main_narrative_coverage_2", "main_narrative_examples_2",
+    "main_narrative_theme_3", "main_narrative_coverage_3", "main_narrative_examples_3",
+    "main_narrative_theme_4", "main_narrative_coverage_4", "main_narrative_examples_4",
+    "main_narrative_theme_5", "main_narrative_coverage_5", "main_narrative_examples_5",
+    "main_narrative_confidence",
+    "sentiment_positive_percentage", "sentiment_negative_percentage", "sentiment_neutral_percentage",
+    "sentiment_confidence",
+    "bias_political_score",
+    "bias_political_leaning", "bias_supporting_evidence", "bias_confidence",
+    "values_promoted_value_1", "values_promoted_examples_1",
+    "values_promoted_value_2", "values_promoted_examples_2",
+    "values_promoted_value_3", "values_promoted_examples_3",
+    "values_promoted_confidence",
+)
+# libyaml's C loader when available, otherwise the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Schema version recorded in PRAGMA user_version once the analyses table is in place
+_SCHEMA_VERSION = 1
+_CREATE_ANALYSES_SQL = """
+    CREATE TABLE IF NOT EXISTS analyses (
+        id TEXT PRIMARY KEY,
+        source_id INTEGER NOT NULL,
+        analysis_date TEXT NOT NULL,
+        numbers_of_articles INTEGER NOT NULL,
+        main_narrative_theme_1 TEXT DEFAULT NULL,
+        main_narrative_coverage_1 REAL DEFAULT 0.0,
+        main_narrative_examples_1 TEXT DEFAULT NULL,
+        main_narrative_theme_2 TEXT DEFAULT NULL,
+        main_narrative_coverage_2 REAL DEFAULT 0.0,
+        main_narrative_examples_2 TEXT DEFAULT NULL,
+        main_narrative_theme_3 TEXT DEFAULT NULL,
+        main_narrative_coverage_3 REAL DEFAULT 0.0,
+        main_narrative_examples_3 TEXT DEFAULT NULL,
+        main_narrative_theme_4 TEXT DEFAULT NULL,
+        main_narrative_coverage_4 REAL DEFAULT 0.0,
+        main_narrative_examples_4 TEXT DEFAULT NULL,
+        main_narrative_theme_5 TEXT DEFAULT NULL,
+        main_narrative_coverage_5 REAL DEFAULT 0.0,
+        main_narrative_examples_5 TEXT DEFAULT NULL,
+        main_narrative_confidence REAL DEFAULT 0.0,
+        sentiment_positive_percentage REAL DEFAULT 0.0,
+        sentiment_negative_percentage REAL DEFAULT 0.0,
+        sentiment_neutral_percentage REAL DEFAULT 0.0,
+        sentiment_confidence REAL DEFAULT 0.0,
+        bias_political_score REAL DEFAULT 0.0,
+        bias_political_leaning TEXT DEFAULT NULL,
+        bias_supporting_evidence TEXT DEFAULT NULL,
+        bias_confidence REAL DEFAULT 0.0,
+        values_promoted_value_1 TEXT DEFAULT NULL,
+        values_promoted_examples_1 TEXT DEFAULT NULL,
+        values_promoted_value_2 TEXT DEFAULT NULL,
+        values_promoted_examples_2 TEXT DEFAULT NULL,
+        values_promoted_value_3 TEXT DEFAULT NULL,
+        values_promoted_examples_3 TEXT DEFAULT NULL,
+        values_promoted_confidence REAL DEFAULT 0.0,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (source_id) REFERENCES sources(source_id) ON DELETE RESTRICT,
+        UNIQUE(source_id, analysis_date) -- Prevent duplicate entries for same source/date
+    )
+"""
+
+# Built once at import; sqlite3's statement cache then reuses the prepared statement
+_INSERT_ANALYSIS_SQL = "INSERT OR REPLACE INTO analyses ({}) VALUES ({})".format(
+    ", ".join(_ANALYSIS_INSERT_COLUMNS), ", ".join("?" * len(_ANALYSIS_INSERT_COLUMNS))
+)
+
+SAVE_BATCH_SIZE = 10  # successful analyses committed together, so a crash loses at most this many
+
+@functools.lru_cache(maxsize=4)
+def load_parsers(config_path: str = "config/parsers.yaml") -> Tuple[str, ...]:
     """
     Loads enabled news source names from a YAML configuration file.
+    The result is cached per path for the life of the process.
     Logs errors if loading fails.
     """
     try:
-        with open(config_path, "r") as file:
-            config = yaml.safe_load(file)
+        with open(config_path, "rb") as file:
+            config = yaml.load(file, Loader=_YAML_LOADER)
             if "parsers" not in config:
                 logger.error(f"Invalid format in {config_path}: 'parsers' key missing")
                 raise ValueError("Invalid parsers.yaml format: 'parsers' key missing")
-            sources = [
+            sources = tuple(
                 parser["name"]
                 for parser in config["parsers"]
                 if parser.get("enabled", False)
-            ]
+            )
             if not sources:
                  logger.warning(f"No enabled parsers found in {config_path}")
             return sources
     except FileNotFoundError:
         logger.error(f"Config file {config_path} not found")
-        return []
+        return ()
     except Exception as e:
         logger.error(f"Error loading {config_path}: {str(e)}")
-        return []
+        return ()
 
 
 def _parse_percentage(value: str, field_name: str) -> float:
@@ -108,12 +198,12 @@ def _parse_percentage(value: str, field_name: str) -> float:
     Parses a percentage string into a float, logging errors.
     Returns 0.0 for invalid or empty values.
     """
-    if not value or not isinstance(value, str):
-        # logger.warning(f"Parsing percentage for '{field_name}': Invalid type or empty value '{value}', defaulting to 0.0")
+    if not value:
         return 0.0
-    parsed_value = value.rstrip("%").strip()
     try:
-        return float(parsed_value)
+        return float(value.strip().removesuffix("%"))
+    except AttributeError: # Not a string
+        return 0.0
     except ValueError:
         logger.error(f"Parsing percentage for '{field_name}': Invalid numeric format '{value}', defaulting to 0.0")
         return 0.0
@@ -124,23 +214,81 @@ def _parse_float(value: str, field_name: str) -> float:
     Parses a string into a float, logging errors.
     Returns 0.0 for invalid or empty values.
     """
-    if not value or not isinstance(value, str):
-        # logger.warning(f"Parsing float for '{field_name}': Invalid type or empty value '{value}', defaulting to 0.0")
+    if not value:
         return 0.0
-    parsed_value = value.strip()
     try:
-        return float(parsed_value)
+        return float(value.strip())
+    except AttributeError: # Not a string
+        return 0.0
     except ValueError:
         logger.error(f"Parsing float for '{field_name}': Invalid numeric format '{value}', defaulting to 0.0")
         return 0.0
 
+
+# Parsers for the numeric AI result fields; every other field is stored as returned
+_NUMERIC_FIELD_PARSERS = {
+    **dict.fromkeys(
+        (
+            "main_narrative_coverage_1", "main_narrative_coverage_2", "main_narrative_coverage_3",
+            "main_narrative_coverage_4", "main_narrative_coverage_5",
+            "sentiment_positive_percentage", "sentiment_negative_percentage", "sentiment_neutral_percentage",
+        ),
+        _parse_percentage,
+    ),
+    **dict.fromkeys(
+        (
+            "main_narrative_confidence", "sentiment_confidence", "bias_political_score",
+            "bias_confidence", "values_promoted_confidence",
+        ),
+        _parse_float,
+    ),
+}
+# AI result fields stored after numbers_of_articles, paired with their parser (or None)
+_ANALYSIS_RESULT_FIELDS = tuple(
+    (column, _NUMERIC_FIELD_PARSERS.get(column)) for column in _ANALYSIS_INSERT_COLUMNS[4:]
+)
+
+def _build_analysis_row(analysis_result: dict, source_id: int, analysis_date: str, num_articles: int) -> tuple:
+    """
+    Builds the analyses INSERT parameters (in _ANALYSIS_INSERT_COLUMNS order) from an AI result.
+    The id depends only on source and day, so a rerun replaces the row instead of duplicating it.
+    """
+    get = analysis_result.get
+    return (
+        hashlib.sha1(f"{source_id}|{analysis_date}".encode("ascii"), usedforsecurity=False).hexdigest(),
+        source_id,
+        analysis_date,
+        int(get("numbers_of_articles", num_articles)),
+        *(parse(get(column), column) if parse else get(column) for column, parse in _ANALYSIS_RESULT_FIELDS),
+    )
+
+def _save_analyses(conn: sqlite3.Connection, cursor: sqlite3.Cursor, rows: list) -> None:
+    """
+    Saves a batch of analysis rows with one executemany in its own transaction.
+    A database error is logged and only loses this batch; earlier batches stay committed.
+    """
+    try:
+        print(f"\n🛠️ Saving {len(rows)} analyses to DB...")
+        logger.info(f"Saving {len(rows)} analyses to DB...")
+        with conn: # One transaction (and one commit) for the batch
+            cursor.executemany(_INSERT_ANALYSIS_SQL, rows)
+        print(f"💾 {len(rows)} analyses saved successfully.")
+        logger.info(f"{len(rows)} analyses saved successfully.")
+    except sqlite3.Error as db_error:
+        print(f"❌ Database insert FAILED: {str(db_error)}")
+        logger.error(f"Database insert FAILED: {str(db_error)}")
+
+# Errors worth retrying: rate limits, timeouts/connection failures and 5xx responses.
+# Anything else (bad key, bad request) won't change on a retry.
+_TRANSIENT_API_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
 # Define retry behaviour specifically for API key check
 retry_api_key_check = retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type(Exception), # Retry on any exception during test call
+    retry=retry_if_exception_type(_TRANSIENT_API_ERRORS), # Only transient errors reach the decorator
     before_sleep=lambda retry_state: print(
-        f"⛔ Retry attempt {retry_state.attempt_number} for API key verification after {retry_state.wait:.1f} seconds due to: {retry_state.outcome.exception()}"
+        f"⛔ Retry attempt {retry_state.attempt_number} for API key verification after {retry_state.upcoming_sleep:.1f} seconds due to: {retry_state.outcome.exception()}"
     ),
     retry_error_callback=lambda retry_state: False # Return False if all retries fail
 )
@@ -148,24 +296,26 @@ retry_api_key_check = retry(
 @retry_api_key_check
 def verify_api_key(api_key: str) -> bool:
     """
-    Verifies the DeepSeek API key by making a minimal test call.
-    Relies on @retry_api_key_check decorator for retries.
-    Returns True if successful, False if all retries fail.
+    Verifies the DeepSeek API key by listing the available models.
+    Relies on @retry_api_key_check decorator for retries, which only happen for
+    transient errors (rate limit, timeout/connection, 5xx).
+    Returns True if successful, False on a non-transient error or if all retries fail.
     """
     # This function now only contains the core logic, retries handled by decorator
     try:
         test_client = OpenAI(
             base_url="https://api.deepseek.com/v1", api_key=api_key, timeout=30.0
         )
-        test_client.chat.completions.create(
-            model="deepseek-chat", # Use appropriate model name if different
-            messages=[{"role": "system", "content": "Test: Return 'OK'"}],
-            max_tokens=10,
-        )
+        # Listing models checks authentication without running (or billing) a completion
+        test_client.models.list()
         return True # Success!
-    except Exception as e:
+    except _TRANSIENT_API_ERRORS:
         # Let the decorator handle logging the retry reason
-        raise e # Re-raise exception to trigger retry
+        raise # Re-raise exception to trigger retry
+    except Exception as e:
+        print(f"⛔ API key verification failed without retrying: {str(e)}")
+        logger.error(f"API key verification failed without retrying: {str(e)}")
+        return False
 
 
 def format_analysis_date_for_db(date_str_human: str) -> str:
@@ -180,13 +330,14 @@ def format_analysis_date_for_db(date_str_human: str) -> str:
         logger.error(f"Could not format analysis date '{date_str_human}' for DB: {e}")
         return None
 
+@functools.lru_cache(maxsize=1)
 def _load_analysis_settings() -> str:
-    """Loads the analysis target_day setting from config/time_settings.yaml."""
+    """Loads the analysis target_day setting from config/time_settings.yaml, once per process."""
     config_path = "config/time_settings.yaml"
     default_strategy = "previous_day" # Default to the original behavior if config is missing/invalid
     try:
-        with open(config_path, "r") as file:
-            config = yaml.safe_load(file)
+        with open(config_path, "rb") as file:
+            config = yaml.load(file, Loader=_YAML_LOADER)
             strategy = config.get("analysis", {}).get("target_day", default_strategy)
             if strategy not in ["current_day", "previous_day"]:
                 logger.warning(f"Invalid analysis:target_day '{strategy}' in {config_path}. Using default: '{default_strategy}'.")
@@ -199,12 +350,29 @@ def _load_analysis_settings() -> str:
         logger.error(f"Error loading analysis settings from {config_path}: {e}. Using default: '{default_strategy}'.")
         return default_strategy
 
+def _ensure_analyses_schema(cursor: sqlite3.Cursor) -> None:
+    """
+    Creates the 'analyses' table unless the database is already at _SCHEMA_VERSION.
+    The version check is a single PRAGMA read, so the DDL only runs on a new database.
+    """
+    if cursor.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+        return
+    print("🛠️ Creating or verifying 'analyses' table schema...")
+    logger.info("Creating or verifying 'analyses' table schema...")
+    cursor.execute(_CREATE_ANALYSES_SQL)
+    cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    print("✅ Schema verified/created.")
+    logger.info("Schema verified/created.")
+
 # --- Main Analysis Function ---
 def analyze_articles() -> None:
     """
     Analyzes news articles from enabled sources, generating reports using the DeepSeek API.
     Logs detailed progress and errors, ensuring continuation even if one source fails AI analysis.
     Determines target analysis date based on config/time_settings.yaml (analysis:target_day).
+    Up to ANALYSIS_CONCURRENCY sources (default 3) are analyzed at once, with API calls started
+    at most once per INTER_SOURCE_DELAY seconds after that initial burst; results are saved
+    on the calling thread in source order, committed SAVE_BATCH_SIZE analyses at a time.
     """
     print("🚀 Starting article analysis script 🚀")
     logger.info("🚀 Starting article analysis script 🚀")
@@ -248,54 +416,7 @@ def analyze_articles() -> None:
     try:
         with db_connection() as conn:
             cursor = conn.cursor()
-            print("🛠️ Creating or verifying 'analyses' table schema...")
-            logger.info("Creating or verifying 'analyses' table schema...")
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS analyses (
-                    id TEXT PRIMARY KEY,
-                    source_id INTEGER NOT NULL,
-                    analysis_date TEXT NOT NULL,
-                    numbers_of_articles INTEGER NOT NULL,
-                    main_narrative_theme_1 TEXT DEFAULT NULL,
-                    main_narrative_coverage_1 REAL DEFAULT 0.0,
-                    main_narrative_examples_1 TEXT DEFAULT NULL,
-                    main_narrative_theme_2 TEXT DEFAULT NULL,
-                    main_narrative_coverage_2 REAL DEFAULT 0.0,
-                    main_narrative_examples_2 TEXT DEFAULT NULL,
-                    main_narrative_theme_3 TEXT DEFAULT NULL,
-                    main_narrative_coverage_3 REAL DEFAULT 0.0,
-                    main_narrative_examples_3 TEXT DEFAULT NULL,
-                    main_narrative_theme_4 TEXT DEFAULT NULL,
-                    main_narrative_coverage_4 REAL DEFAULT 0.0,
-                    main_narrative_examples_4 TEXT DEFAULT NULL,
-                    main_narrative_theme_5 TEXT DEFAULT NULL,
-                    main_narrative_coverage_5 REAL DEFAULT 0.0,
-                    main_narrative_examples_5 TEXT DEFAULT NULL,
-                    main_narrative_confidence REAL DEFAULT 0.0,
-                    sentiment_positive_percentage REAL DEFAULT 0.0,
-                    sentiment_negative_percentage REAL DEFAULT 0.0,
-                    sentiment_neutral_percentage REAL DEFAULT 0.0,
-                    sentiment_confidence REAL DEFAULT 0.0,
-                    bias_political_score REAL DEFAULT 0.0,
-                    bias_political_leaning TEXT DEFAULT NULL,
-                    bias_supporting_evidence TEXT DEFAULT NULL,
-                    bias_confidence REAL DEFAULT 0.0,
-                    values_promoted_value_1 TEXT DEFAULT NULL,
-                    values_promoted_examples_1 TEXT DEFAULT NULL,
-                    values_promoted_value_2 TEXT DEFAULT NULL,
-                    values_promoted_examples_2 TEXT DEFAULT NULL,
-                    values_promoted_value_3 TEXT DEFAULT NULL,
-                    values_promoted_examples_3 TEXT DEFAULT NULL,
-                    values_promoted_confidence REAL DEFAULT 0.0,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (source_id) REFERENCES sources(source_id) ON DELETE RESTRICT,
-                    UNIQUE(source_id, analysis_date) -- Prevent duplicate entries for same source/date
-                )
-                """
-            )
-            print("✅ Schema verified/created.")
-            logger.info("Schema verified/created.")
+            _ensure_analyses_schema(cursor)
 
             # --- Determine Target Date for Query based on Strategy ---
             utc_now = datetime.now(dateutil.tz.UTC)
@@ -312,71 +433,74 @@ def analyze_articles() -> None:
             print(f"🔍 Querying articles published on {target_date_str} UTC for sources: {parser_sources}")
             logger.info(f"Querying articles published on {target_date_str} UTC for sources: {parser_sources}")
 
-            # --- Query Execution (uses target_date_str) ---
-            cursor.execute(
-                """
-                SELECT s.source_id, s.name AS source_name, a.clean_content, a.publication_date
-                FROM articles a
-                JOIN sources s ON a.source_id = s.source_id
-                WHERE strftime('%Y-%m-%d', a.publication_date) = ? AND s.name IN ({})
-                """.format(','.join('?'*len(parser_sources))),
-                (target_date_str, *parser_sources),
+            inter_source_delay = int(os.getenv("INTER_SOURCE_DELAY", 120))
+            concurrency = max(1, int(os.getenv("ANALYSIS_CONCURRENCY", 3)))
+            # Spaces out API calls like the old inter-source sleep, without idling while a call is in flight;
+            # every DeepSeek call (including later chunks of a large source) takes a token
+            analyzer.rate_limiter = (
+                TokenBucket(1 / inter_source_delay, concurrency) if inter_source_delay > 0 else None
             )
-            # Group articles by source name
-            source_articles_map = defaultdict(list)
-            # Store source_id and a representative publication date per source
-            source_context_map = {}
-            for row in cursor.fetchall(): # Use fetchall to process after query completion
-                source_name = row["source_name"]
-                source_articles_map[source_name].append(row["clean_content"])
-                if source_name not in source_context_map:
-                    source_context_map[source_name] = {
-                        "source_id": row["source_id"],
-                        "publication_date": row["publication_date"] # Store one date for context
+
+            # Rows are saved SAVE_BATCH_SIZE at a time, each batch in one transaction
+            pending_rows = []
+
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            try:
+                # --- Query Execution (uses target_date_str) ---
+                # Ordered by source so each source's rows arrive together and can be
+                # grouped while streaming, without holding every source's content at once.
+                # The day is matched as a range on the raw column (stored as YYYY-MM-DD HH:MM:SS)
+                # so the publication_date indexes can be used, as in the API's date filter
+                cursor.execute(
+                    """
+                    SELECT s.source_id, s.name AS source_name, a.clean_content, a.publication_date
+                    FROM articles a
+                    JOIN sources s ON a.source_id = s.source_id
+                    WHERE a.publication_date >= ? AND a.publication_date < date(?, '+1 day')
+                      AND s.name IN ({})
+                    ORDER BY s.name
+                    """.format(','.join('?'*len(parser_sources))),
+                    (target_date_str, target_date_str, *parser_sources),
+                )
+                # Each source is submitted as soon as its rows are read; its article contents are
+                # only referenced by the pending call and are released once that call returns
+                submitted = [] # (source_name, source_id, num_articles, future)
+                # Rows are read by position, in SELECT order: source_id, source_name, clean_content, publication_date
+                for source_name, rows in groupby(cursor, key=itemgetter(1)):
+                    source_id, _, first_content, publication_date = next(rows)
+                    articles = [first_content, *(row[2] for row in rows)]
+                    ai_context = {
+                        "source": source_name,
+                        "articles": articles,
+                        "publication_date": publication_date, # Pass one date for analysis context
                     }
+                    future = executor.submit(analyzer.analyze_articles, ai_context, source_name)
+                    submitted.append((source_name, source_id, len(articles), future))
 
-            total_sources_found = len(source_articles_map)
-            if total_sources_found == 0:
-                print(f"⚠️ No articles found in DB for defined parsers published on {target_date_str} UTC. Exiting.")
-                logger.warning(f"No articles found in DB for defined parsers published on {target_date_str} UTC. Exiting.")
-                return
+                total_sources_found = len(submitted)
+                if total_sources_found == 0:
+                    print(f"⚠️ No articles found in DB for defined parsers published on {target_date_str} UTC. Exiting.")
+                    logger.warning(f"No articles found in DB for defined parsers published on {target_date_str} UTC. Exiting.")
+                    return
 
-            print(f"ℹ️ Found articles for {total_sources_found} sources published on {target_date_str} UTC.")
-            logger.info(f"Found articles for {total_sources_found} sources published on {target_date_str} UTC.")
-            inter_source_delay = int(os.getenv("INTER_SOURCE_DELAY", 120))
-            print(f"⏳ Using inter-source delay of {inter_source_delay} seconds between source analyses.")
-            logger.info(f"Using inter-source delay of {inter_source_delay} seconds between source analyses.")
-
-            sources_processed_count = 0
-            # --- Process Each Source ---
-            for source_name, articles in source_articles_map.items():
-                sources_processed_count += 1
-                log_prefix = f"[{sources_processed_count}/{total_sources_found}] Source='{source_name}' Date='{target_date_str}'"
-                num_articles = len(articles)
-
-                print(f"\n{log_prefix}: -------- START PROCESSING [{num_articles} articles] --------")
-                logger.info(f"{log_prefix}: Start processing {num_articles} articles.")
-
-                # --- Skip if 0 articles for this source ---
-                if num_articles == 0:
-                    # This case shouldn't happen with how we queried, but good to keep
-                    print(f"{log_prefix}: Skipping analysis, 0 articles found for this source.")
-                    logger.warning(f"{log_prefix}: Skipping analysis, 0 articles found for this source.")
-                else:
-                    source_id = source_context_map[source_name]["source_id"]
-                    publication_date_for_ai = source_context_map[source_name]["publication_date"]
-
-                    # --- Call AI Analyzer within a try block ---
+                print(f"ℹ️ Found articles for {total_sources_found} sources published on {target_date_str} UTC.")
+                logger.info(f"Found articles for {total_sources_found} sources published on {target_date_str} UTC.")
+                print(f"⏳ Analyzing up to {concurrency} sources at once, starting one API call every {inter_source_delay} seconds after the first {concurrency}.")
+                logger.info(f"Analyzing up to {concurrency} sources at once, starting one API call every {inter_source_delay} seconds after the first {concurrency}.")
+
+                # --- Process Each Source ---
+                # Results are handled in submission order on this thread, which owns the DB connection
+                for sources_processed_count, (source_name, source_id, num_articles, future) in enumerate(submitted, 1):
+                    log_prefix = f"[{sources_processed_count}/{total_sources_found}] Source='{source_name}' Date='{target_date_str}'"
+
+                    print(f"\n{log_prefix}: -------- START PROCESSING [{num_articles} articles] --------")
+                    logger.info(f"{log_prefix}: Start processing {num_articles} articles.")
+
+                    # --- Wait for the AI Analyzer within a try block ---
                     try:
-                        print(f"{log_prefix}: Calling AIAnalyzer.analyze_articles...")
-                        logger.info(f"{log_prefix}: Calling AIAnalyzer.analyze_articles...")
-                        ai_context = {
-                            "source": source_name,
-                            "articles": articles,
-                            "publication_date": publication_date_for_ai, # Pass date for analysis context
-                            "cursor": cursor # Pass cursor if AIAnalyzer needs it (check AIAnalyzer code)
-                        }
-                        analysis_result = analyzer.analyze_articles(ai_context, source_name)
+                        print(f"{log_prefix}: Waiting for AIAnalyzer.analyze_articles...")
+                        logger.info(f"{log_prefix}: Waiting for AIAnalyzer.analyze_articles...")
+                        analysis_result = future.result()
 
                         # --- Handle AI Result ---
                         if "error" in analysis_result:
@@ -398,78 +522,10 @@ def analyze_articles() -> None:
                                 logger.error(f"{log_prefix}: Skipping save, could not format analysis date '{target_date_str}' for DB.")
                                 # Continue to next source if date formatting fails
                             else:
-                                # Build values list for INSERT (35 fields in order)
-                                values_list = [
-                                    hashlib.md5(f"{source_name}{analysis_date_db}{datetime.now()}".encode()).hexdigest(), # Unique ID
-                                    source_id,
-                                    analysis_date_db,
-                                    int(analysis_result.get("numbers_of_articles", num_articles)),
-                                    analysis_result.get("main_narrative_theme_1"),
-                                    _parse_percentage(analysis_result.get("main_narrative_coverage_1"), "narrative_coverage_1"),
-                                    analysis_result.get("main_narrative_examples_1"),
-                                    analysis_result.get("main_narrative_theme_2"),
-                                    _parse_percentage(analysis_result.get("main_narrative_coverage_2"), "narrative_coverage_2"),
-                                    analysis_result.get("main_narrative_examples_2"),
-                                    analysis_result.get("main_narrative_theme_3"),
-                                    _parse_percentage(analysis_result.get("main_narrative_coverage_3"), "narrative_coverage_3"),
-                                    analysis_result.get("main_narrative_examples_3"),
-                                    analysis_result.get("main_narrative_theme_4"),
-                                    _parse_percentage(analysis_result.get("main_narrative_coverage_4"), "narrative_coverage_4"),
-                                    analysis_result.get("main_narrative_examples_4"),
-                                    analysis_result.get("main_narrative_theme_5"),
-                                    _parse_percentage(analysis_result.get("main_narrative_coverage_5"), "narrative_coverage_5"),
-                                    analysis_result.get("main_narrative_examples_5"),
-                                    _parse_float(analysis_result.get("main_narrative_confidence"), "narrative_confidence"),
-                                    _parse_percentage(analysis_result.get("sentiment_positive_percentage"), "sentiment_positive"),
-                                    _parse_percentage(analysis_result.get("sentiment_negative_percentage"), "sentiment_negative"),
-                                    _parse_percentage(analysis_result.get("sentiment_neutral_percentage"), "sentiment_neutral"),
-                                    _parse_float(analysis_result.get("sentiment_confidence"), "sentiment_confidence"),
-                                    _parse_float(analysis_result.get("bias_political_score"), "bias_score"),
-                                    analysis_result.get("bias_political_leaning"),
-                                    analysis_result.get("bias_supporting_evidence"),
-                                    _parse_float(analysis_result.get("bias_confidence"), "bias_confidence"),
-                                    analysis_result.get("values_promoted_value_1"),
-                                    analysis_result.get("values_promoted_examples_1"),
-                                    analysis_result.get("values_promoted_value_2"),
-                                    analysis_result.get("values_promoted_examples_2"),
-                                    analysis_result.get("values_promoted_value_3"),
-                                    analysis_result.get("values_promoted_examples_3"),
-                                    _parse_float(analysis_result.get("values_promoted_confidence"), "values_confidence"),
-                                ]
-
-                                try:
-                                    # --- Insert the Record ---
-                                    placeholders = ', '.join(['?'] * 35) # 35 columns
-                                    insert_sql = f"""
-                                        INSERT OR REPLACE INTO analyses (
-                                            id, source_id, analysis_date, numbers_of_articles,
-                                            main_narrative_theme_1, main_narrative_coverage_1, main_narrative_examples_1,
-                                            main_narrative_theme_2, main_narrative_coverage_2, main_narrative_examples_2,
-                                            main_narrative_theme_3, main_narrative_coverage_3, main_narrative_examples_3,
-                                            main_narrative_theme_4, main_narrative_coverage_4, main_narrative_examples_4,
-                                            main_narrative_theme_5, main_narrative_coverage_5, main_narrative_examples_5,
-                                            main_narrative_confidence,
-                                            sentiment_positive_percentage, sentiment_negative_percentage, sentiment_neutral_percentage,
-                                            sentiment_confidence,
-                                            bias_political_score,
-                                            bias_political_leaning, bias_supporting_evidence, bias_confidence,
-                                            values_promoted_value_1, values_promoted_examples_1,
-                                            values_promoted_value_2, values_promoted_examples_2,
-                                            values_promoted_value_3, values_promoted_examples_3,
-                                            values_promoted_confidence
-                                        ) VALUES ({placeholders})
-                                        """
-                                    print(f"{log_prefix}: 🛠️ Saving analysis to DB...")
-                                    logger.info(f"{log_prefix}: Saving analysis to DB...")
-                                    cursor.execute(insert_sql, tuple(values_list)) # Use tuple
-                                    conn.commit()
-                                    print(f"{log_prefix}: 💾 Analysis saved successfully.")
-                                    logger.info(f"{log_prefix}: Analysis saved successfully.")
-
-                                except sqlite3.Error as db_error:
-                                    print(f"{log_prefix}: ❌ Database insert FAILED: {str(db_error)}")
-                                    logger.error(f"{log_prefix}: Database insert FAILED: {str(db_error)}")
-                                    # Continue to next source even if DB save fails
+                                row = _build_analysis_row(analysis_result, source_id, analysis_date_db, num_articles)
+                                print(f"{log_prefix}: 🛠️ Queued analysis for saving.")
+                                logger.info(f"{log_prefix}: Queued analysis for saving.")
+                                pending_rows.append(row)
 
                     except Exception as e: # Catch unexpected errors during AI call or parsing for this source
                          print(f"{log_prefix}: ❌ Unhandled exception during processing: {str(e)}")
@@ -478,15 +534,20 @@ def analyze_articles() -> None:
                          logger.info(f"{log_prefix}: Continuing to next source after unhandled exception.")
                          # Continue to the next source
 
-                # --- Apply inter-source delay ---
-                # This runs after successful save OR after logging AI failure/exception and continuing
-                if sources_processed_count < total_sources_found:
-                     print(f"{log_prefix}: ⏳ Sleeping for {inter_source_delay} seconds before next source...")
-                     logger.info(f"{log_prefix}: Sleeping for {inter_source_delay} seconds before next source...")
-                     time.sleep(inter_source_delay)
+                    print(f"{log_prefix}: -------- END PROCESSING --------")
+                    logger.info(f"{log_prefix}: End processing.")
+
+                    # Commit finished analyses as the run goes, so an interrupted run keeps them
+                    if len(pending_rows) >= SAVE_BATCH_SIZE:
+                        _save_analyses(conn, cursor, pending_rows)
+                        pending_rows = []
 
-                print(f"{log_prefix}: -------- END PROCESSING --------")
-                logger.info(f"{log_prefix}: End processing.")
+                # --- Save Remaining Successful Analyses ---
+                if pending_rows:
+                    _save_analyses(conn, cursor, pending_rows)
+            finally:
+                # Don't start analyses nobody will save if the loop above failed
+                executor.shutdown(wait=True, cancel_futures=True)
 
     # --- Catch DB Connection Error ---
     except sqlite3.Error as conn_error:
@@ -498,6 +559,7 @@ def analyze_articles() -> None:
 
     print("\n✅ Article analysis script finished.")
     logger.info("✅ Article analysis script finished.")
+    memory_handler.flush() # Write out the run's buffered log records
 
 
 if __name__ == "__main__":
@@ -26,8 +26,11 @@ Usage:
     ✅ Completed article collection: 64 articles collected at 2025-02-26 22:40:00
 """
 
+import functools
 import hashlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from importlib import import_module
 from typing import Dict
@@ -35,7 +38,7 @@ from typing import Dict
 import dateutil
 import yaml
 
-from backend.src.media_utils import get_all_media_sources
+from backend.src.media_utils import get_media_source_names
 from backend.src.news_utils import (
     clean_article,
     db_connection,
@@ -49,6 +52,35 @@ from backend.src.news_utils import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when available, otherwise the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+INSERT_BATCH_SIZE = 1000  # rows per executemany() call when saving articles
+
+# One statement string for every source, so sqlite3's statement cache reuses it
+_INSERT_ARTICLE_SQL = """
+    INSERT OR IGNORE INTO articles
+        (id, source_id, raw_title, raw_description,
+         clean_content, categories, link, publication_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml(path: str, mtime: float) -> dict:
+    """
+    Parses a YAML file, caching the result until the file's modification time changes.
+
+    Args:
+        path (str): Path to the YAML file.
+        mtime (float): The file's current os.path.getmtime(), part of the cache key.
+
+    Returns:
+        dict: The parsed document. Shared between callers, so treat it as read-only.
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 def load_parsers(config_path: str = "config/parsers.yaml") -> list:
     """
@@ -74,8 +106,7 @@ def load_parsers(config_path: str = "config/parsers.yaml") -> list:
         ['fox_news', 'bbc', 'nbc']
     """
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml(config_path, os.path.getmtime(config_path))
         active_parsers = []
         for parser_config in config["parsers"]:
             if not parser_config["enabled"]:
@@ -99,6 +130,149 @@ def load_parsers(config_path: str = "config/parsers.yaml") -> list:
         return []
 
 
+def _fetch_one(parser) -> list:
+    """
+    Fetches and parses every feed of one source.
+
+    Runs on a worker thread, so it only touches the parser's own state; the
+    database work for the returned articles is left to _persist_one.
+
+    Args:
+        parser: An initialized parser instance (e.g., BBCParser).
+
+    Returns:
+        list[dict]: The raw articles returned by the parser.
+    """
+    parser.articles = []
+    parser.run()
+    return parser.parse()
+
+
+def _existing_article_ids(cursor, article_ids: list) -> set:
+    """
+    Returns the subset of `article_ids` already present in the articles table.
+
+    Looks the ids up INSERT_BATCH_SIZE at a time, keeping each IN list well
+    under SQLite's bound-parameter limit.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor on the articles database.
+        article_ids (list[str]): Candidate article ids.
+
+    Returns:
+        set[str]: The ids that are already stored.
+    """
+    existing = set()
+    for i in range(0, len(article_ids), INSERT_BATCH_SIZE):
+        batch = article_ids[i : i + INSERT_BATCH_SIZE]
+        cursor.execute(
+            f"SELECT id FROM articles WHERE id IN ({','.join('?' * len(batch))})",
+            batch,
+        )
+        existing.update(row[0] for row in cursor)
+    return existing
+
+
+def _persist_one(parser, raw_articles: list) -> int:
+    """
+    Deduplicates, cleans and saves one source's articles to the database.
+
+    Articles whose id is already stored are skipped before cleaning.
+
+    Args:
+        parser: The parser the articles came from, used for its source name and feeds.
+        raw_articles (list[dict]): Articles returned by _fetch_one.
+
+    Returns:
+        int: The number of new articles saved.
+    """
+    deduped = remove_duplicates(raw_articles)
+    print(f"Removed {len(raw_articles) - len(deduped)} duplicates")
+
+    cleaning_stats = {
+        "html_entities": 0,
+        "html_tags": 0,
+        "whitespace_fixes": 0,
+    }
+
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        # Check if the source exists, insert only if it doesn't
+        cursor.execute(
+            "SELECT source_id FROM sources WHERE name = ?",
+            (parser.source_name,),
+        )
+        source_row = cursor.fetchone()
+        if source_row:
+            source_id = source_row["source_id"]
+        else:
+            cursor.execute(
+                "INSERT INTO sources (name) VALUES (?)",
+                (parser.source_name,),
+            )
+            source_id = cursor.lastrowid # source_id is the table's INTEGER PRIMARY KEY
+
+        article_ids = [
+            hashlib.md5(f"{article['title']}{article['description']}".encode()).hexdigest()
+            for article in deduped
+        ]
+        # Feeds overlap heavily between runs; skip (and don't clean) articles already saved
+        existing_ids = _existing_article_ids(cursor, article_ids)
+        if existing_ids:
+            print(f"Skipped {len(existing_ids)} articles already in the database")
+
+        # Category fallback for articles without one: the name of the feed they came from
+        feed_name_by_url = {url: name for name, url in parser.feeds.items()}
+        cleaned_count = 0
+        rows = [] # Flushed every INSERT_BATCH_SIZE rows to bound memory on large feeds
+        for article_id, article in zip(article_ids, deduped):
+            if article_id in existing_ids:
+                continue
+            cleaned_art, stats = clean_article(
+                {
+                    "title": article.get("title", ""),
+                    "description": article.get("description", ""),
+                }
+            )
+            categories = article.get("categories", [])
+            if not categories and "feed_url" in article:
+                categories = [feed_name_by_url.get(article["feed_url"], "unknown")]
+            if not categories:
+                logger.warning(
+                    f"No categories found for article: {article.get('title', 'Unknown')}"
+                )
+            ai_input = prepare_ai_input(cleaned_art, categories=categories)
+            cleaning_stats["html_entities"] += stats["html_entities"]
+            cleaning_stats["html_tags"] += stats["html_tags"]
+            cleaning_stats["whitespace_fixes"] += stats["whitespace_fixes"]
+            unified_pub_date = unify_date_format(
+                article.get("publication_date", "")
+            )
+            rows.append(
+                (
+                    article_id,
+                    source_id,
+                    article.get("title", ""),
+                    article.get("description", ""),
+                    ai_input["content"],
+                    ",".join(ai_input["metadata"]["categories"]),
+                    article.get("link", ""),
+                    unified_pub_date,
+                )
+            )
+            if len(rows) == INSERT_BATCH_SIZE:
+                cursor.executemany(_INSERT_ARTICLE_SQL, rows)
+                cleaned_count += len(rows)
+                rows.clear()
+        cursor.executemany(_INSERT_ARTICLE_SQL, rows)
+        cleaned_count += len(rows)
+        # Every batch of the source goes in under one commit
+        conn.commit()
+    print(f"🧹 Cleaning Stats: {cleaning_stats}")
+    print(f"💾 Saved {cleaned_count} {parser.source_name} articles")
+    return cleaned_count
+
+
 def collect_articles() -> Dict[str, int]:
     """
     Collects news articles from enabled sources and stores them in the database.
@@ -107,6 +281,11 @@ def collect_articles() -> Dict[str, int]:
     'news_analysis.db'. Verifies sources against `media_sources` using the `source` field. Prints
     progress with emojis and logs errors. Uses source_id for relations with the sources table.
 
+    Every verified source is fetched at once on its own worker thread, so a run takes
+    about as long as the slowest source rather than the sum of all of them. Each source
+    is saved on the calling thread as soon as its fetch finishes, keeping SQLite writes
+    on a single thread.
+
     Returns:
         dict: A dictionary mapping source names to the number of articles saved.
 
@@ -123,115 +302,35 @@ def collect_articles() -> Dict[str, int]:
     sources = load_parsers()
     init_database()
 
-    all_sources_data = {}
+    # Verify sources exist in media_sources using the source field, loading the names once per run
+    media_source_names = get_media_source_names()
+    verified_sources = []
     for parser in sources:
-        print(f"\n=== Collecting {parser.source_name} ===")
-        # Verify source exists in media_sources using the source field
-        media_source = next(
-            (ms for ms in get_all_media_sources() if ms.source == parser.source_name),
-            None,
-        )
-        if not media_source:
+        if parser.source_name not in media_source_names:
             print(
                 f"⚠️ Source {parser.source_name} not found in media_sources, skipping collection"
             )
             logger.warning(f"Source {parser.source_name} not found in media_sources")
             continue
+        verified_sources.append(parser)
 
-        try:
-            parser.articles = []
-            parser.run()
-            raw_articles = parser.parse()
-            deduped = remove_duplicates(raw_articles)
-            print(f"Removed {len(raw_articles) - len(deduped)} duplicates")
-
-            cleaning_stats = {
-                "html_entities": 0,
-                "html_tags": 0,
-                "whitespace_fixes": 0,
+    all_sources_data = {}
+    if verified_sources:
+        with ThreadPoolExecutor(max_workers=len(verified_sources)) as executor:
+            futures = {
+                executor.submit(_fetch_one, parser): parser for parser in verified_sources
             }
-
-            with db_connection() as conn:
-                cursor = conn.cursor()
-                # Check if the source exists, insert only if it doesn't
-                cursor.execute(
-                    "SELECT source_id FROM sources WHERE name = ?",
-                    (parser.source_name,),
-                )
-                source_row = cursor.fetchone()
-                if source_row:
-                    source_id = source_row["source_id"]
-                else:
-                    cursor.execute(
-                        "INSERT INTO sources (name) VALUES (?)",
-                        (parser.source_name,),
-                    )
-                    cursor.execute(
-                        "SELECT source_id FROM sources WHERE name = ?",
-                        (parser.source_name,),
-                    )
-                    source_id = cursor.fetchone()["source_id"]
-
-                cleaned_count = 0
-                for article in deduped:
-                    cleaned_art, stats = clean_article(
-                        {
-                            "title": article.get("title", ""),
-                            "description": article.get("description", ""),
-                        }
+            for future in as_completed(futures):
+                parser = futures[future]
+                print(f"\n=== Collecting {parser.source_name} ===")
+                try:
+                    all_sources_data[parser.source_name] = _persist_one(
+                        parser, future.result()
                     )
-                    categories = article.get("categories", [])
-                    if not categories and "feed_url" in article:
-                        feed_name = next(
-                            (
-                                name
-                                for name, url in parser.feeds.items()
-                                if url == article["feed_url"]
-                            ),
-                            "unknown",
-                        )
-                        categories = [feed_name]
-                    if not categories:
-                        logger.warning(
-                            f"No categories found for article: {article.get('title', 'Unknown')}"
-                        )
-                    ai_input = prepare_ai_input(cleaned_art, categories=categories)
-                    cleaning_stats["html_entities"] += stats["html_entities"]
-                    cleaning_stats["html_tags"] += stats["html_tags"]
-                    cleaning_stats["whitespace_fixes"] += stats["whitespace_fixes"]
-                    article_id = hashlib.md5(
-                        f"{article['title']}{article['description']}".encode()
-                    ).hexdigest()
-                    unified_pub_date = unify_date_format(
-                        article.get("publication_date", "")
-                    )
-                    cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO articles 
-                                     (id, source_id, raw_title, raw_description, 
-                                      clean_content, categories, link, publication_date)
-                                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            article_id,
-                            source_id,
-                            article.get("title", ""),
-                            article.get("description", ""),
-                            ai_input["content"],
-                            ",".join(ai_input["metadata"]["categories"]),
-                            article.get("link", ""),
-                            unified_pub_date,
-                        ),
-                    )
-                    cleaned_count += 1
-                conn.commit()
-                print(f"🧹 Cleaning Stats: {cleaning_stats}")
-                print(f"💾 Saved {cleaned_count} {parser.source_name} articles")
-                all_sources_data[parser.source_name] = cleaned_count
-        except Exception as e:
-            print(f"❌ Collection error: {str(e)}")
-            logger.error(f"Collection error for {parser.source_name}: {str(e)}")
-            continue
+                except Exception as e:
+                    print(f"❌ Collection error: {str(e)}")
+                    logger.error(f"Collection error for {parser.source_name}: {str(e)}")
+                    continue
 
     timestamp = datetime.now(dateutil.tz.UTC).strftime(
         "%Y-%m-%d %H:%M:%S"
@@ -65,6 +65,8 @@ class AIAnalyzer:
             prompt_template (str): Template for DeepSeek prompt with article data and rules.
             rules (str): Strict rules for analysis (e.g., 5 themes, no fabricated data).
             example (str): Example output for DeepSeek to follow.
+            rate_limiter (TokenBucket | None): Shared limiter acquired before every API call. When
+                set, it replaces the INTER_SOURCE_DELAY sleep between chunks (default None).
         """
         self.client = OpenAI(
             base_url="https://api.deepseek.com/v1",
@@ -73,6 +75,7 @@ class AIAnalyzer:
         )
         self.model = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
         self.chunk_size = 60  # Max articles per call to fit within 8192 tokens (~24,000 chars input with 400 chars/article)
+        self.rate_limiter = None
 
         self.prompt_template = "\n".join(
             [
@@ -386,12 +389,14 @@ class AIAnalyzer:
         Analyzes a batch of articles using the DeepSeek API, handling chunking and retries.
 
         Processes articles in chunks of up to 60, sending them to the DeepSeek API for narrative,
-        sentiment, bias, and values analysis. Applies no delay before the first chunk, a delay after
-        a chunk only if there are more chunks to analyze for the same source, and an inter-source delay
-        after all chunks. Retries on API errors and prints progress with emojis.
+        sentiment, bias, and values analysis. With a shared `rate_limiter`, every API call waits for
+        a token; otherwise it applies no delay before the first chunk and a delay after a chunk only
+        if there are more chunks to analyze for the same source. Retries on API errors and prints
+        progress with emojis.
 
         Args:
-            context (dict): Context dictionary with 'source', 'articles', and optionally 'cursor' for database access.
+            context (dict): Context dictionary with 'source', 'articles', and optionally 'publication_date'
+                ('YYYY-MM-DD HH:MM:SS' UTC) or a 'cursor' to look it up in the database.
             source_name (str): The name of the news source (e.g., 'bbc', 'fox_news').
 
         Returns:
@@ -414,8 +419,9 @@ class AIAnalyzer:
             if not articles:
                 raise ValueError("No articles to analyze")
 
-            publication_date = None
-            if articles:
+            # Callers on another thread pass the date in directly, as a cursor can't be shared
+            publication_date = context.get("publication_date")
+            if not publication_date:
                 cursor = context.get("cursor")
                 if cursor:
                     cursor.execute(
@@ -434,6 +440,7 @@ class AIAnalyzer:
 
             results = []
             num_chunks = (len(articles) + self.chunk_size - 1) // self.chunk_size
+            chunk_delay = int(os.getenv("INTER_SOURCE_DELAY", 120)) # Read once, not per chunk
             for i in range(0, len(articles), self.chunk_size):
                 chunk = articles[i : i + self.chunk_size]
                 prepared = self._prepare_content(context, chunk, publication_date)
@@ -445,6 +452,8 @@ class AIAnalyzer:
                     example=self.example,
                 )
 
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
                 response = self.client.chat.completions.create(
                     model=self.model,
                     messages=[{"role": "system", "content": formatted_prompt}],
@@ -461,12 +470,12 @@ class AIAnalyzer:
                 parsed = self._parse_response(raw_response)
                 results.append(parsed)
                 # Apply delay only if there are more chunks to process for this source
-                if i + self.chunk_size < len(articles):
-                    delay = int(os.getenv("INTER_SOURCE_DELAY", 120))
+                # (a shared rate limiter, when set, already spaces the calls out)
+                if self.rate_limiter is None and i + self.chunk_size < len(articles):
                     print(
-                        f"⏳ Parsed chunk {i//self.chunk_size + 1} for {source_name}, sleeping for {delay}s"
+                        f"⏳ Parsed chunk {i//self.chunk_size + 1} for {source_name}, sleeping for {chunk_delay}s"
                     )
-                    time.sleep(delay)
+                    time.sleep(chunk_delay)
                 else:
                     print(
                         f"⏳ Parsed chunk {i//self.chunk_size + 1} for {source_name}, sleeping for 0s"
@@ -667,3 +667,36 @@ def get_all_media_sources(db_path: str = "news_analysis.db") -> list[MediaSource
         print(f"❌ Failed to retrieve media sources: {str(e)}")
         logger.error(f"Database error retrieving media sources: {str(e)}")
         return []
+
+
+def get_media_source_names(db_path: str = "news_analysis.db") -> set[str]:
+    """
+    Retrieves the source names (e.g., 'nbc') that have a media_sources entry.
+
+    A lightweight alternative to get_all_media_sources() for callers that only need to
+    know whether a source is registered, without building every MediaSource.
+
+    Args:
+        db_path (str, optional): Path to the SQLite database file. Defaults to 'news_analysis.db'.
+
+    Returns:
+        set[str]: Source names from the `sources` table linked to a media source.
+
+    Example:
+        >>> 'nbc' in get_media_source_names()
+        True
+    """
+    try:
+        with db_connection(db_path) as conn:
+            cursor = conn.execute(
+                """
+                SELECT s.name
+                FROM media_sources ms
+                JOIN sources s ON ms.source_id = s.source_id
+                """
+            )
+            return {row[0] for row in cursor}
+    except sqlite3.Error as e:
+        print(f"❌ Failed to retrieve media source names: {str(e)}")
+        logger.error(f"Database error retrieving media source names: {str(e)}")
+        return set()
@@ -23,18 +23,23 @@ Usage:
     >>> cleaned, stats = clean_article({'title': 'News', 'description': '<p>Content</p>'})
 """
 
+import email.utils
+import functools
 import html
 import logging
 import os
 import random
 import re
 import sqlite3
+import threading
+import time
 from datetime import datetime
 
 import dateutil
 import dateutil.parser
 from bs4 import BeautifulSoup
 from dateutil.relativedelta import relativedelta
+from urllib3.util.request import ACCEPT_ENCODING
 
 # Configure logging to write INFO and ERROR messages to logs/db_maintenance.log
 logging.basicConfig(
@@ -45,6 +50,60 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def init_articles_fts(conn: sqlite3.Connection) -> None:
+    """
+    Creates the full-text index used by the API's keyword search, if it is missing.
+
+    Idempotent, so both init_database() and the API's startup can call it; an existing
+    database gets the index (built from its current articles) the first time either runs.
+    Does nothing when the articles table doesn't exist yet. The caller commits.
+
+    Args:
+        conn (sqlite3.Connection): An open connection to the articles database.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles'"
+    )
+    if cursor.fetchone() is None:
+        return
+
+    # Full-text index over article titles and content for keyword search.
+    # External-content table kept in sync with articles via triggers.
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+    )
+    fts_exists = cursor.fetchone() is not None
+    cursor.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+            raw_title, clean_content, content='articles', content_rowid='rowid'
+        )
+    """
+    )
+    cursor.executescript(
+        """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+            INSERT INTO articles_fts (rowid, raw_title, clean_content)
+            VALUES (new.rowid, new.raw_title, new.clean_content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, raw_title, clean_content)
+            VALUES ('delete', old.rowid, old.raw_title, old.clean_content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+            INSERT INTO articles_fts (articles_fts, rowid, raw_title, clean_content)
+            VALUES ('delete', old.rowid, old.raw_title, old.clean_content);
+            INSERT INTO articles_fts (rowid, raw_title, clean_content)
+            VALUES (new.rowid, new.raw_title, new.clean_content);
+        END;
+    """
+    )
+    if not fts_exists:
+        # Index articles collected before the FTS table existed
+        cursor.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+
+
 def init_database(db_path: str = "news_analysis.db") -> None:
     """
     Initialize the SQLite database with sources, articles, and analyses tables.
@@ -173,6 +232,11 @@ def init_database(db_path: str = "news_analysis.db") -> None:
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_articles_publication_date ON articles (publication_date)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_source_pubdate ON articles (source_id, publication_date)"
+        )
+
+        init_articles_fts(conn)
 
         # Add indexes for analyses
         cursor.execute(
@@ -203,7 +267,9 @@ def init_database(db_path: str = "news_analysis.db") -> None:
         raise
 
 
-def db_connection(db_path: str = "news_analysis.db") -> sqlite3.Connection:
+def db_connection(
+    db_path: str = "news_analysis.db", check_same_thread: bool = True
+) -> sqlite3.Connection:
     """
     Establishes an optimized connection to the SQLite database.
 
@@ -212,6 +278,8 @@ def db_connection(db_path: str = "news_analysis.db") -> sqlite3.Connection:
     
     Args:
         db_path (str, optional): Path to the SQLite database file. Defaults to 'news_analysis.db'.
+        check_same_thread (bool, optional): Passed to sqlite3.connect. Set to False when the
+            connection is handed between threads (e.g., a streamed API response). Defaults to True.
 
     Returns:
         sqlite3.Connection: A database connection object for queries.
@@ -227,19 +295,63 @@ def db_connection(db_path: str = "news_analysis.db") -> sqlite3.Connection:
         >>> print(row['source_id'])
         1
     """
-    conn = sqlite3.connect(db_path, timeout=60.0)  # Add 60-second connection timeout
+    conn = sqlite3.connect(
+        db_path, timeout=60.0, check_same_thread=check_same_thread
+    )  # Add 60-second connection timeout
     conn.row_factory = sqlite3.Row
     
     # Apply performance optimizations to this connection
+    conn.execute("PRAGMA journal_mode=WAL")    # Write-ahead log for concurrent readers
     conn.execute("PRAGMA synchronous=NORMAL")  # Balance between safety and speed
     conn.execute("PRAGMA temp_store=MEMORY")   # Store temporary tables in memory
     conn.execute("PRAGMA cache_size=-64000")   # 64MB cache (negative means KB)
+    conn.execute("PRAGMA mmap_size=268435456")  # Read via 256MB memory map, skipping read() copies
     conn.execute("PRAGMA foreign_keys=ON")     # Enforce referential integrity
     conn.execute("PRAGMA busy_timeout=60000")  # 60-second timeout on busy database
     
     return conn
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how often a shared resource is used.
+
+    Used for per-host feed fetching and for DeepSeek API calls. Tokens refill at
+    `rate` per second up to `capacity`, so up to `capacity` requests can go out
+    back to back before callers are spaced 1/rate apart.
+    A caller short of a token takes it on credit and sleeps outside the lock
+    until it would have refilled, so concurrent callers queue in order.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# e.g. 'gzip, deflate, br' when Brotli is installed
+_ACCEPT_ENCODING = ", ".join(ACCEPT_ENCODING.split(","))
+
+# Compiled once for clean_article, which runs for every new article
+_HTML_ENTITY_RE = re.compile(r"&\w+;")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def get_random_headers() -> dict:
     """
     Generates a random set of HTTP headers with diverse user agents and common
@@ -294,8 +406,8 @@ def get_random_headers() -> dict:
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
         # Keep common language preference
         "Accept-Language": "en-US,en;q=0.9", # Prioritize US English slightly
-        # Keep standard encoding preferences
-        "Accept-Encoding": "gzip, deflate, br",
+        # Only the encodings urllib3 can decode here (br needs the Brotli package)
+        "Accept-Encoding": _ACCEPT_ENCODING,
         # Keep other common browser headers
         "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
@@ -334,11 +446,15 @@ def clean_article(article: dict) -> tuple[str, dict]:
     stats = {"html_entities": 0, "html_tags": 0, "whitespace_fixes": 0}
     content = f"{article.get('title', '')}. {article.get('description', '')}"
     decoded_content = html.unescape(content)
-    stats["html_entities"] = len(re.findall(r"&\w+;", content))
-    soup = BeautifulSoup(decoded_content, "html.parser")
-    clean_text = soup.get_text()
-    stats["html_tags"] = len(soup.find_all())
-    cleaned_text = re.sub(r"\s+", " ", clean_text).strip()
+    stats["html_entities"] = len(_HTML_ENTITY_RE.findall(content))
+    if "<" in decoded_content or "&" in decoded_content:
+        soup = BeautifulSoup(decoded_content, "html.parser")
+        clean_text = soup.get_text()
+        stats["html_tags"] = len(soup.find_all())
+    else:
+        # No markup or entities left for BeautifulSoup to handle; most feed items are plain text
+        clean_text = decoded_content
+    cleaned_text = _WHITESPACE_RE.sub(" ", clean_text).strip()
     stats["whitespace_fixes"] = len(clean_text.split()) - len(cleaned_text.split())
     return cleaned_text, stats
 
@@ -400,11 +516,44 @@ def remove_duplicates(articles: list[dict]) -> list[dict]:
     return unique_articles
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_date(date_str: str) -> datetime:
+    """
+    Parses a feed date string, trying the common RSS formats before dateutil.
+
+    Almost every feed date is ISO-8601 (e.g., '2025-02-23T14:58:00Z') or RFC-2822
+    (e.g., 'Sun, 23 Feb 2025 14:58:00 GMT'), which the standard library parses far
+    faster than dateutil.parser. Anything else, and RFC-2822 dates without a usable
+    zone, falls through to dateutil so results match it exactly. Results are
+    cached because the same strings recur across feeds and runs.
+
+    Args:
+        date_str (str): The date string to parse.
+
+    Returns:
+        datetime: The parsed datetime (timezone-aware when the string carries a zone).
+
+    Raises:
+        ValueError: If no parser understands the string (raised by dateutil).
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(date_str)
+        if parsed.tzinfo is not None:
+            return parsed
+    except (TypeError, ValueError, IndexError):
+        pass
+    return dateutil.parser.parse(date_str)
+
+
 def unify_date_format(date_str: str) -> str:
     """
     Converts various date formats to a unified 'YYYY-MM-DD HH:MM:SS' UTC format.
 
-    Parses date strings (e.g., 'Sun, 23 Feb 2025 14:58:00 -0500') using dateutil.parser,
+    Parses date strings (e.g., 'Sun, 23 Feb 2025 14:58:00 -0500') using parse_date,
     converts them to UTC, and formats them consistently for database storage. Logs warnings
     for parsing failures and falls back to the current UTC time if necessary.
 
@@ -424,7 +573,7 @@ def unify_date_format(date_str: str) -> str:
         '2025-02-23 19:58:00'
     """
     try:
-        parsed_date = dateutil.parser.parse(date_str)
+        parsed_date = parse_date(date_str)
         return parsed_date.astimezone(dateutil.tz.UTC).strftime("%Y-%m-%d %H:%M:%S")
     except Exception as e:
         logger.warning(f"⚠️ Could not parse date {date_str}: {str(e)}")
@@ -61,3 +61,23 @@ def test_analyze_articles(mock_openai, analyzer, mock_context):
     assert result is not None
     if result:
         assert int(result["numbers_of_articles"]) == 2
+
+
+def test_analyze_articles_uses_rate_limiter_between_chunks(analyzer, mock_context):
+    """Test that a shared rate limiter replaces the sleep between chunks.
+
+    Splits two articles into two chunks and checks that each API call takes a
+    token from the limiter and that no INTER_SOURCE_DELAY sleep happens.
+    """
+    analyzer.chunk_size = 1
+    analyzer.rate_limiter = MagicMock()
+    mock_context["publication_date"] = "2025-02-23 14:58:00"
+    analyzer.client.chat.completions.create.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="numbers_of_articles=1"))]
+    )
+    with patch("backend.src.ai_processor.time.sleep") as mock_sleep:
+        result = analyzer.analyze_articles(mock_context, "bbc")
+    assert result["numbers_of_articles"] == "2"
+    assert result["analysis_date"] == "February 23, 2025"
+    assert analyzer.rate_limiter.acquire.call_count == 2
+    mock_sleep.assert_not_called()
@@ -0,0 +1,203 @@
+# backend/tests/test_api.py
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from backend.api import app, _media_cache, _close_pool, _source_id_for_name
+from backend.src.news_utils import init_database, db_connection
+
+
+@pytest.fixture
+def client(temp_db):
+    """Fixture providing a TestClient backed by a seeded temporary database.
+
+    Initializes the schema in the temporary database, inserts one source with one
+    article and one analysis, and points the API's db_connection at that file.
+    """
+    init_database(temp_db)
+    with db_connection(temp_db) as conn:
+        conn.execute("INSERT INTO sources (name) VALUES ('bbc')")
+        conn.execute(
+            """
+            INSERT INTO articles (id, source_id, raw_title, raw_description, clean_content,
+                                  categories, link, publication_date)
+            VALUES ('art1', 1, 'Ukraine War', 'Details', 'Ukraine War. Details', 'world',
+                    'http://example.com/1', '2025-02-23 14:58:00')
+            """
+        )
+        conn.execute(
+            """
+            INSERT INTO analyses (id, source_id, analysis_date, numbers_of_articles,
+                                  main_narrative_theme_1, bias_political_score)
+            VALUES ('an1', 1, '2025-02-23', 1, 'Conflict', -1.5)
+            """
+        )
+        conn.commit()
+    _source_id_for_name.cache_clear()
+    with patch(
+        "backend.api.db_connection",
+        lambda **kwargs: db_connection(temp_db, **kwargs),
+    ):
+        yield TestClient(app)
+    _close_pool()
+    _source_id_for_name.cache_clear()
+
+
+def test_get_analyses_all_fields(client):
+    """Test that /analyses returns every column by default."""
+    response = client.get("/analyses", params={"source": "bbc"})
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body) == 1
+    assert body[0]["source_name"] == "bbc"
+    assert body[0]["main_narrative_theme_1"] == "Conflict"
+    assert "values_promoted_confidence" in body[0]
+
+
+def test_get_analyses_projected_fields(client):
+    """Test that the `fields` parameter restricts the returned columns."""
+    response = client.get(
+        "/analyses", params={"fields": "bias_political_score,source_name"}
+    )
+    assert response.status_code == 200
+    assert response.json() == [{"source_name": "bbc", "bias_political_score": -1.5}]
+
+
+def test_get_analyses_unknown_field(client):
+    """Test that unknown columns in `fields` are rejected."""
+    response = client.get("/analyses", params={"fields": "id,password"})
+    assert response.status_code == 400
+
+
+def test_get_articles(client):
+    """Test that /articles maps rows onto the Article model."""
+    response = client.get("/articles", params={"source": "bbc", "keyword": "Ukraine"})
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body) == 1
+    assert body[0]["id"] == "art1"
+    assert body[0]["source_name"] == "bbc"
+    assert body[0]["publication_date"] == "2025-02-23 14:58:00"
+
+
+def test_health_check(client):
+    """Test that /health reports the database and last activity times."""
+    response = client.get("/health")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["database"]["status"] == "healthy"
+    assert body["last_activity"]["collection"] != "unknown"
+    assert body["last_activity"]["analysis"] != "unknown"
+
+
+def test_media_sources_etag(client, sample_media_source):
+    """Test that /media_sources is served from cache and honours If-None-Match.
+
+    Mocks get_all_media_sources, checks that a second request reuses the cached
+    payload, and that sending the returned ETag back yields 304 Not Modified.
+    """
+    _media_cache.clear()
+    with patch(
+        "backend.api.get_all_media_sources", return_value=[sample_media_source]
+    ) as mock_get:
+        first = client.get("/media_sources")
+        assert first.status_code == 200
+        assert first.json()[0]["name"] == "NBC News"
+        etag = first.headers["etag"]
+
+        second = client.get("/media_sources", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert mock_get.call_count == 1
+    _media_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({"date": "2025-02-23"}, 1),
+        ({"date": "2025-02-24"}, 0),
+        ({"keyword": "ukrain"}, 1),
+        ({"keyword": 'War" OR "x'}, 0),
+        ({"keyword": ". "}, 1),
+        ({"keyword": "*?"}, 0),
+        ({"keyword": "Ukraine War"}, 1),
+        ({"keyword": "War. Det"}, 1),
+        ({"keyword": "War, Details"}, 0),
+        ({"keyword": "c++"}, 0),
+        ({"keyword": "WAR. det"}, 1),
+        ({"keyword": " Ukraine "}, 1),
+        ({"keyword": "Ukraine_War"}, 0),
+        ({"keyword": "   "}, 1),
+        ({"keyword": "_"}, 1),
+    ],
+)
+def test_get_articles_filters(client, params, expected):
+    """Test the /articles date range and full-text keyword filters."""
+    response = client.get("/articles", params=params)
+    assert response.status_code == 200
+    assert len(response.json()) == expected
+
+
+def test_startup_creates_missing_fts_index(client, temp_db):
+    """Test that startup indexes a database created before articles_fts existed."""
+    with db_connection(temp_db) as conn:
+        conn.executescript(
+            """
+            DROP TRIGGER articles_fts_ai;
+            DROP TRIGGER articles_fts_ad;
+            DROP TRIGGER articles_fts_au;
+            DROP TABLE articles_fts;
+            """
+        )
+    with client:  # Entering the client runs the lifespan startup
+        response = client.get("/articles", params={"keyword": "ukrain"})
+    assert response.status_code == 200
+    assert [a["id"] for a in response.json()] == ["art1"]
+
+
+def test_get_articles_streams_in_batches(client, temp_db):
+    """Test that a result spanning several fetchmany() batches is valid JSON."""
+    with db_connection(temp_db) as conn:
+        conn.execute(
+            """
+            INSERT INTO articles (id, source_id, raw_title, clean_content, link, publication_date)
+            VALUES ('art2', 1, 'Second', 'Second', 'http://example.com/2', '2025-02-23 15:00:00')
+            """
+        )
+        conn.commit()
+    with patch("backend.api.STREAM_BATCH_SIZE", 1):
+        response = client.get("/articles")
+    assert response.status_code == 200
+    assert sorted(a["id"] for a in response.json()) == ["art1", "art2"]
+
+
+def test_get_analyses_columnar_layout(client):
+    """Test that layout=columns returns column names once and rows as arrays."""
+    response = client.get(
+        "/analyses",
+        params={"fields": "source_name,bias_political_score", "layout": "columns"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "columns": ["source_name", "bias_political_score"],
+        "rows": [["bbc", -1.5]],
+    }
+
+
+@pytest.mark.parametrize("path", ["/articles", "/analyses"])
+def test_unknown_source_returns_empty(client, path):
+    """Test that filtering on a source that doesn't exist returns no rows."""
+    response = client.get(path, params={"source": "missing"})
+    assert response.status_code == 200
+    assert response.json() == []
+    # Misses aren't cached, so a source added later is still found
+    assert _source_id_for_name.cache_info().currsize == 0
+
+
+@pytest.mark.parametrize(
+    "date, status",
+    [("2025-02-23", 200), ("2025-13-01", 400), ("2025-2-3", 400), ("2025-02-23\n", 400)],
+)
+def test_get_analyses_date_validation(client, date, status):
+    """Test that /analyses only accepts YYYY-MM-DD dates."""
+    response = client.get("/analyses", params={"date": date})
+    assert response.status_code == status
@@ -0,0 +1,73 @@
+# backend/tests/test_db_maintenance.py
+import asyncio
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from backend.db_maintenance import quick_optimize_database, run_scheduler, seconds_until_next_run
+from backend.src.news_utils import db_connection, init_database
+
+
+def test_quick_optimize_truncates_wal(temp_db):
+    """Test that maintenance checkpoints the WAL and truncates it to zero bytes."""
+    init_database(temp_db)
+    writer = db_connection(temp_db)
+    try:
+        writer.execute("INSERT INTO sources (name) VALUES ('bbc')")
+        writer.commit()
+        assert os.path.getsize(f"{temp_db}-wal") > 0
+
+        quick_optimize_database(temp_db)
+
+        assert os.path.getsize(f"{temp_db}-wal") == 0
+    finally:
+        writer.close()
+
+
+def _fixed_now(monkeypatch, now):
+    """Patches db_maintenance's datetime.now() to return `now`."""
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr("backend.db_maintenance.datetime", FixedDatetime)
+
+
+@pytest.mark.parametrize(
+    "now, expected",
+    [
+        (datetime(2025, 2, 24, 3, 0), 30 * 60),  # Later the same day
+        (datetime(2025, 2, 24, 3, 29, 59), 1),
+        (datetime(2025, 2, 24, 3, 30), 24 * 3600),  # Just ran, so tomorrow
+        (datetime(2025, 2, 24, 4, 0), 23.5 * 3600),
+        (datetime(2025, 2, 28, 23, 45), 3 * 3600 + 45 * 60),  # Wraps past the month end
+    ],
+)
+def test_seconds_until_next_run(monkeypatch, now, expected):
+    """Test the delay to the next 03:30 run from times before, at and after it."""
+    _fixed_now(monkeypatch, now)
+    assert seconds_until_next_run() == expected
+
+
+def test_run_scheduler_sleeps_until_each_run(monkeypatch):
+    """Test that the scheduler sleeps for the computed delay before each optimization."""
+    _fixed_now(monkeypatch, datetime(2025, 2, 24, 4, 0))
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) == 2:
+            raise asyncio.CancelledError
+
+    with patch("backend.db_maintenance.asyncio.sleep", fake_sleep), patch(
+        "backend.db_maintenance.quick_optimize_database"
+    ) as mock_optimize:
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(run_scheduler())
+
+    assert sleeps == [23.5 * 3600, 23.5 * 3600]
+    mock_optimize.assert_called_once_with()
@@ -4,6 +4,7 @@ from backend.src.media_utils import (
     init_media_database,
     save_media_source,
     get_media_source,
+    get_media_source_names,
     calculate_media_bias,
 )
 import sqlite3
@@ -69,3 +70,11 @@ def test_calculate_media_bias(temp_db, sample_media_source):
     bias_result = calculate_media_bias("NBC News", temp_db)
     assert "calculated_bias_score" in bias_result
     assert -5 <= bias_result["calculated_bias_score"] <= 5
+
+
+def test_get_media_source_names(temp_db, sample_media_source):
+    """Test that get_media_source_names returns the source names of saved media sources."""
+    init_media_database(temp_db)
+    assert get_media_source_names(temp_db) == set()
+    save_media_source(sample_media_source, temp_db)
+    assert get_media_source_names(temp_db) == {sample_media_source.source}
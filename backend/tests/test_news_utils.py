@@ -6,7 +6,11 @@ from backend.src.news_utils import (
     remove_duplicates,
     unify_date_format,
     vacuum_database,
+    db_connection,
+    parse_date,
+    get_random_headers,
 )
+from urllib3.response import HTTPResponse
 from bs4 import BeautifulSoup
 import sqlite3
 import dateutil
@@ -21,6 +25,8 @@ import datetime
             "Test & Article. Content & More",
         ),
         ({"title": "", "description": "<div>Empty</div>"}, ". Empty"),
+        ({"title": "Plain  title", "description": "No\tmarkup\n"}, "Plain title. No markup"),
+        ({"title": "Escaped", "description": "&lt;b&gt;Bold&lt;/b&gt;"}, "Escaped. Bold"),
     ],
 )
 def test_clean_article(article, expected):
@@ -82,3 +88,36 @@ def test_vacuum_database(temp_db):
     conn.commit()
     vacuum_database(temp_db)
     conn.close()
+
+
+def test_db_connection_pragmas(temp_db):
+    """Test that db_connection applies the WAL, cache and mmap tuning."""
+    with db_connection(temp_db) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "Sun, 23 Feb 2025 14:58:00 GMT",
+        "Sun, 23 Feb 2025 14:58:00 -0500",
+        "Sun, 23 Feb 2025 14:58:00 -0000",
+        "2025-02-23T14:58:00Z",
+        "2025-02-23T14:58:00+01:00",
+        "2025-02-23 14:58:00",
+        "February 23, 2025 2:58 PM",
+    ],
+)
+def test_parse_date_matches_dateutil(date_str):
+    """Test that the fast paths in parse_date agree with dateutil.parser."""
+    assert parse_date(date_str) == dateutil.parser.parse(date_str)
+    assert parse_date(date_str).utcoffset() == dateutil.parser.parse(date_str).utcoffset()
+
+
+def test_random_headers_only_advertise_decodable_encodings():
+    """Test that Accept-Encoding never asks for an encoding urllib3 can't decode."""
+    encodings = get_random_headers()["Accept-Encoding"].split(", ")
+    assert "gzip" in encodings
+    assert set(encodings) <= set(HTTPResponse.CONTENT_DECODERS)
@@ -1,16 +1,23 @@
 # backend/tests/test_parsers.py
 import pytest
-from backend.parsers.base_parser import BaseParser
+from backend.parsers.base_parser import BaseParser, TokenBucket, _HOST_BUCKETS, _feed_cache_paths, now_str
 from backend.parsers.bbc_parser import BBCParser
 from backend.parsers.fox_parser import FoxParser
 from backend.parsers.nbc_parser import NBCParser
 from backend.parsers.dw_parser import DWParser
+from backend.parsers.france24_parser import France24Parser
 from unittest.mock import patch, MagicMock
-from backend.src.news_utils import unify_date_format
+from backend.src.news_utils import parse_date, unify_date_format
 import feedparser
+import pickle
+import requests
+from tenacity import wait_combine, wait_exponential, wait_none, wait_random
 from datetime import datetime, timedelta
 import yaml
+import time
+import threading
 import dateutil.tz
+from logging.handlers import RotatingFileHandler
 
 # Load parser configuration
 with open("config/parsers.yaml", "r") as file:
@@ -72,13 +79,33 @@ def dw_parser():
     return DWParser({feed["name"]: feed["url"] for feed in dw_config["feeds"]})
 
 
+@pytest.fixture
+def france24_parser():
+    """Fixture providing a France24Parser instance.
+
+    Creates a France24Parser instance using the feed URLs for France24 from parsers.yaml,
+    designed to test entry parsing.
+    """
+    france_config = next(p for p in parsers_config["parsers"] if p["name"] == "france")
+    return France24Parser({feed["name"]: feed["url"] for feed in france_config["feeds"]})
+
+
+@pytest.fixture(autouse=True)
+def feed_cache_dir(tmp_path, monkeypatch):
+    """Fixture pointing the conditional-GET feed cache at a temporary directory."""
+    monkeypatch.setattr("backend.parsers.base_parser.FEED_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@patch("backend.parsers.base_parser.HTTP_SESSION.get")
 @patch("backend.parsers.base_parser.feedparser.parse")
-def test_base_fetch_feed(mock_parse, base_parser):
+def test_base_fetch_feed(mock_parse, mock_get, base_parser):
     """Test fetching an RSS feed.
 
-    Mocks feedparser.parse to return a feed with one entry,
+    Mocks the shared HTTP session and feedparser.parse to return a feed with one entry,
     verifies fetch_feed works with a real BBC URL.
     """
+    mock_get.return_value = MagicMock(status_code=200, headers={}, content=b"<rss/>")
     mock_feed = MagicMock(
         entries=[{"title": "Test", "link": "http://test.com"}], bozo=0
     )
@@ -87,6 +114,29 @@ def test_base_fetch_feed(mock_parse, base_parser):
     assert len(feed.entries) == 1
 
 
+@pytest.mark.parametrize(
+    "error",
+    [requests.exceptions.ConnectionError("reset"), requests.exceptions.Timeout("slow")],
+)
+def test_base_fetch_feed_retries_transient_errors(base_parser, error):
+    """Test that fetch_feed retries transient network errors until its 5 attempts run out."""
+    with patch("backend.parsers.base_parser.HTTP_SESSION.get", side_effect=error) as mock_get, \
+            patch.object(base_parser, "wait_for_host"), \
+            patch.object(base_parser, "load_cached_feed", return_value=None), \
+            patch.object(BaseParser.fetch_feed.retry, "wait", wait_none()):
+        with pytest.raises(type(error)):
+            base_parser.fetch_feed("http://feeds.bbci.co.uk/news/world/rss.xml")
+    assert mock_get.call_count == 5
+
+
+def test_base_fetch_feed_retry_wait_has_jitter():
+    """Test that fetch_feed's backoff adds a random component on top of the exponential wait."""
+    wait = BaseParser.fetch_feed.retry.wait
+    assert isinstance(wait, wait_combine)
+    assert any(isinstance(w, wait_random) for w in wait.wait_funcs)
+    assert any(isinstance(w, wait_exponential) for w in wait.wait_funcs)
+
+
 @patch("backend.parsers.base_parser.BaseParser.is_yesterday", return_value=True)
 def test_base_is_yesterday(mock_is_yesterday, base_parser):
     """Test identifying yesterday's date.
@@ -106,9 +156,9 @@ def test_bbc_extract_categories(bbc_parser):
     Provides a sample entry with a 'world' term,
     verifies extract_categories returns a list.
     """
-    entry = {"tags": [{"term": "world"}]}
+    entry = {"tags": [{"term": "world"}, {"term": ""}]}
     result = bbc_parser.extract_categories(entry)
-    assert isinstance(result, list)
+    assert result == ["world"]
 
 
 def test_fox_extract_categories(fox_parser):
@@ -121,6 +171,15 @@ def test_fox_extract_categories(fox_parser):
     result = fox_parser.extract_categories(entry)
     assert isinstance(result, list)
 
+    entry = {
+        "tags": [
+            {"term": "news/taxonomy/politics", "scheme": "taxonomy"},
+            {"term": "world", "scheme": "other"},
+            {"term": "us", "scheme": None},
+        ]
+    }
+    assert fox_parser.extract_categories(entry) == ["politics"]
+
 
 def test_nbc_extract_categories(nbc_parser):
     """Test extracting categories from an NBC RSS entry.
@@ -132,6 +191,15 @@ def test_nbc_extract_categories(nbc_parser):
     result = nbc_parser.extract_categories(entry)
     assert isinstance(result, list)
 
+    entry = {
+        "tags": [
+            {"term": "news/category/politics", "scheme": "category"},
+            {"term": "world", "scheme": "other"},
+            {"term": "us", "scheme": None},
+        ]
+    }
+    assert nbc_parser.extract_categories(entry) == ["politics"]
+
 
 def test_dw_extract_categories(dw_parser):
     """Test extracting categories from a DW RSS entry.
@@ -172,3 +240,260 @@ def test_is_within_time_window(base_parser):
         date_outside = (reference_time - timedelta(hours=30)).strftime("%Y-%m-%d %H:%M:%S")
         result = base_parser.is_within_time_window(date_outside)
         assert not result, f"Expected date {date_outside} to be outside 20 hours of {reference_time}"
+
+
+def test_base_run_collects_feeds_in_order(base_parser):
+    """Test that run() fetches feeds concurrently but keeps feed order.
+
+    Mocks process_feed so the first feed finishes last and one feed fails,
+    verifies articles from the other feeds are kept in configuration order.
+    """
+    base_parser.feeds = {"first": "http://a.com/1", "second": "http://b.com/2", "broken": "http://c.com/3"}
+
+    def fake_process_feed(feed_name, url):
+        if feed_name == "broken":
+            raise ValueError("bad feed")
+        if feed_name == "first":
+            time.sleep(0.05)
+        return [{"link": url}]
+
+    with patch.object(base_parser, "process_feed", side_effect=fake_process_feed):
+        base_parser.run()
+    assert [a["link"] for a in base_parser.articles] == ["http://a.com/1", "http://b.com/2"]
+
+
+def test_base_run_dedupes_articles_by_link(base_parser):
+    """Test that an article cross-posted in several feeds is kept once."""
+    base_parser.feeds = {"world": "http://a.com/world", "europe": "http://a.com/europe"}
+
+    def fake_process_feed(feed_name, url):
+        return [{"link": "http://a.com/story", "feed_url": url}, {"link": url, "feed_url": url}]
+
+    with patch.object(base_parser, "process_feed", side_effect=fake_process_feed):
+        base_parser.run()
+    assert [a["link"] for a in base_parser.articles] == [
+        "http://a.com/story", "http://a.com/world", "http://a.com/europe"
+    ]
+    assert base_parser.articles[0]["feed_url"] == "http://a.com/world"
+
+
+def test_token_bucket_allows_burst_then_waits():
+    """Test that a bucket lets `capacity` requests through, then spaces them by 1/rate."""
+    with patch("backend.src.news_utils.time") as mock_time:
+        mock_time.monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=0.5, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        mock_time.sleep.assert_not_called()
+        bucket.acquire()
+        mock_time.sleep.assert_called_once_with(2.0)
+
+
+def test_wait_for_host_uses_one_bucket_per_host(base_parser):
+    """Test that rate limiting is tracked per host."""
+    _HOST_BUCKETS.clear()
+    base_parser.wait_for_host("http://a.com/1")
+    base_parser.wait_for_host("http://a.com/2")
+    base_parser.wait_for_host("http://b.com/1")
+    assert set(_HOST_BUCKETS) == {"a.com", "b.com"}
+    assert _HOST_BUCKETS["a.com"].tokens == pytest.approx(0, abs=0.01)
+    _HOST_BUCKETS.clear()
+
+
+@patch("backend.parsers.base_parser.HTTP_SESSION.get")
+def test_download_feed_conditional_get(mock_get, base_parser):
+    """Test that a cached feed is revalidated and reused on 304 Not Modified.
+
+    The first response carries an ETag and is cached; the second request must send
+    If-None-Match and, on a 304, return the cached body.
+    """
+    url = "http://feeds.bbci.co.uk/news/world/rss.xml"
+    mock_get.return_value = MagicMock(
+        status_code=200,
+        headers={"ETag": '"v1"', "Content-Type": "application/rss+xml"},
+        content=b"<rss>v1</rss>",
+    )
+    assert base_parser.download_feed(url)[0] == b"<rss>v1</rss>"
+
+    mock_get.return_value = MagicMock(status_code=304, headers={}, content=b"")
+    body, headers = base_parser.download_feed(url)
+    assert body == b"<rss>v1</rss>"
+    assert headers == {"content-type": "application/rss+xml"}
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_parse_feed_reuses_parse_for_unchanged_body(base_parser):
+    """Test that parsing the same body twice only runs feedparser once."""
+    url = "http://feeds.bbci.co.uk/news/world/rss.xml"
+    body = b"<rss><channel><item><title>Test</title><link>http://test.com</link></item></channel></rss>"
+    with patch(
+        "backend.parsers.base_parser.feedparser.parse", wraps=feedparser.parse
+    ) as mock_parse:
+        first = base_parser.parse_feed(url, body)
+        second = base_parser.parse_feed(url, body)
+        assert mock_parse.call_count == 1
+        base_parser.parse_feed(url, body.replace(b"Test", b"Changed"))
+        assert mock_parse.call_count == 2
+    assert second.entries[0].title == first.entries[0].title == "Test"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not a pickle",  # UnpicklingError
+        pickle.dumps(42),  # TypeError when unpacked
+        b"cmissing_feedparser_module\nFeedParserDict\n.",  # ModuleNotFoundError
+    ],
+)
+def test_parse_feed_replaces_unreadable_cache(base_parser, feed_cache_dir, payload):
+    """Test that an unreadable parsed-feed pickle is treated as a miss and rewritten."""
+    url = "http://feeds.bbci.co.uk/news/world/rss.xml"
+    body = b"<rss><channel><item><title>Test</title><link>http://test.com</link></item></channel></rss>"
+    parsed_path = _feed_cache_paths(url)[2]
+    with open(parsed_path, "wb") as file:
+        file.write(payload)
+
+    feed = base_parser.parse_feed(url, body)
+
+    assert feed.entries[0].title == "Test"
+    with open(parsed_path, "rb") as file:
+        assert pickle.load(file)[1].entries[0].title == "Test"
+
+
+def test_run_fixes_time_window_for_the_run(base_parser):
+    """Test that run() computes the cutoff once and clears it afterwards."""
+    base_parser.feeds = {"world": "http://a.com/1"}
+    windows = []
+
+    def fake_process_feed(feed_name, url):
+        windows.append((base_parser._now, base_parser._cutoff, base_parser._cutoff_ts))
+        return []
+
+    with patch.object(base_parser, "process_feed", side_effect=fake_process_feed):
+        base_parser.run()
+    now, cutoff, cutoff_ts = windows[0]
+    assert now - cutoff == timedelta(hours=base_parser.lookback_hours)
+    assert cutoff_ts == cutoff.timestamp()
+    assert base_parser._cutoff is None and base_parser._cutoff_ts is None
+
+
+def test_parsers_log_to_their_own_error_file(base_parser, dw_parser):
+    """Test that each source gets its own error log handler instead of base_errors.log."""
+    files = {
+        parser.source_name: [h.baseFilename for h in parser.logger.handlers]
+        for parser in (base_parser, dw_parser)
+    }
+    assert files["base"][0].endswith("logs/base_errors.log")
+    assert files["dw"][0].endswith("logs/dw_errors.log")
+    assert isinstance(dw_parser.logger.handlers[0], RotatingFileHandler)
+    # A second instance reuses the source's handler instead of opening another
+    assert DWParser({}).logger.handlers == dw_parser.logger.handlers
+
+
+def test_entry_within_time_window_uses_published_parsed(base_parser):
+    """Test that feedparser's parsed date is used without re-parsing the raw string."""
+    now = datetime.now(dateutil.tz.UTC)
+    recent = (now - timedelta(hours=1)).timetuple()
+    old = (now - timedelta(hours=base_parser.lookback_hours + 1)).timetuple()
+    with patch.object(base_parser, "is_within_time_window") as mock_window:
+        assert base_parser.entry_within_time_window({"published_parsed": recent, "published": "x"})
+        assert not base_parser.entry_within_time_window({"published_parsed": old, "published": "x"})
+        mock_window.assert_not_called()
+        base_parser.entry_within_time_window({"published": "Sun, 23 Feb 2025 14:58:00 GMT"})
+        mock_window.assert_called_once_with("Sun, 23 Feb 2025 14:58:00 GMT")
+
+
+def test_entry_within_time_window_skips_undated_entries(base_parser):
+    """Test that entries without a date are dropped without a parse attempt or error."""
+    with patch.object(base_parser, "is_within_time_window") as mock_window, patch.object(
+        base_parser.logger, "error"
+    ) as mock_error:
+        assert not base_parser.entry_within_time_window({"published": ""})
+        assert not base_parser.entry_within_time_window({"title": "No date"})
+    mock_window.assert_not_called()
+    mock_error.assert_not_called()
+
+
+def test_process_feed_checks_time_window_before_validating(base_parser):
+    """Test that entries outside the time window are dropped before validation."""
+    old = (datetime.now(dateutil.tz.UTC) - timedelta(days=30)).timetuple()
+    feed = MagicMock(entries=[{"published_parsed": old, "published": "x"}])
+    base_parser.start_time_window()
+    with patch.object(base_parser, "fetch_feed", return_value=feed), patch.object(
+        base_parser, "validate_entry"
+    ) as mock_validate:
+        assert base_parser.process_feed("world", "http://example.com/rss") == []
+    mock_validate.assert_not_called()
+
+
+def test_dw_process_feed_parses_each_date_once(dw_parser):
+    """Test that DW passes the parsed date to parse_entry instead of re-parsing it."""
+    published = (datetime.now(dateutil.tz.UTC) - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+    entry = feedparser.FeedParserDict(title="Story", link="http://dw.com/a", updated=published)
+    with patch.object(dw_parser, "fetch_feed", return_value=MagicMock(entries=[entry])), patch(
+        "backend.parsers.dw_parser.parse_date", wraps=parse_date
+    ) as mock_parse_date:
+        articles = dw_parser.process_feed("general", "http://rss.dw.com/rdf/rss-en-all")
+    assert mock_parse_date.call_count == 1
+    assert articles[0]["publication_date"] == published[:19].replace("T", " ")
+
+
+def test_iter_articles_yields_before_later_feeds_finish(base_parser):
+    """Test that articles from the first feed are available while later feeds still run."""
+    base_parser.feeds = {"first": "http://a.com/1", "second": "http://b.com/2"}
+    release = threading.Event()
+
+    def fake_process_feed(feed_name, url):
+        if feed_name == "second":
+            release.wait(5)
+        return [{"link": url}]
+
+    with patch.object(base_parser, "process_feed", side_effect=fake_process_feed):
+        articles = base_parser.iter_articles()
+        assert next(articles)["link"] == "http://a.com/1"
+        release.set()
+        assert [a["link"] for a in articles] == ["http://b.com/2"]
+
+
+def test_parse_entry_does_not_share_article_dicts(base_parser):
+    """Test that articles built from the per-feed template are independent copies."""
+    url = "http://feeds.bbci.co.uk/news/world/rss.xml"
+    first = base_parser.parse_entry({"title": "One", "link": "http://a.com/1"}, url)
+    second = base_parser.parse_entry({"title": "Two", "link": "http://a.com/2"}, url)
+    assert (first["title"], second["title"]) == ("One", "Two")
+    assert first["source"] == "base" and first["feed_url"] == url
+    assert base_parser.article_template(url)["title"] == ""
+
+
+def test_france24_parse_entry_dates(france24_parser):
+    """Test France24 publication dates, including the fallback for unparseable ones."""
+    url = "https://www.france24.com/en/france/rss"
+    entry = feedparser.FeedParserDict(
+        title="One", link="http://a.com/1", published="Sun, 23 Feb 2025 14:58:00 GMT"
+    )
+    assert france24_parser.parse_entry(entry, url)["publication_date"] == "2025-02-23 14:58:00"
+
+    entry = feedparser.FeedParserDict(title="Two", link="http://a.com/2", published="not a date")
+    with patch.object(france24_parser.logger, "error") as mock_error:
+        article = france24_parser.parse_entry(entry, url)
+    mock_error.assert_called_once()
+    assert datetime.strptime(article["publication_date"], "%Y-%m-%d %H:%M:%S")
+
+
+def test_now_str_formats_once_per_second():
+    """Test that the fallback timestamp is reused within the same second."""
+    with patch("backend.parsers.base_parser.time.time", return_value=1740322680.2):
+        first = now_str()
+    with patch("backend.parsers.base_parser.time.time", return_value=1740322680.9):
+        assert now_str() is first
+    assert first == datetime.fromtimestamp(1740322680).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def test_france24_extract_categories(france24_parser):
+    """Test that France24 returns the entry's primary category.
+
+    feedparser resolves `category` to the first tag's term, so only that one is kept.
+    """
+    entry = feedparser.FeedParserDict(tags=[{"term": "France"}, {"term": "Europe"}])
+    assert france24_parser.extract_categories(entry) == ["France"]
+    assert france24_parser.extract_categories(feedparser.FeedParserDict()) == []
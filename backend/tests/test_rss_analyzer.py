@@ -7,9 +7,19 @@ import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 import dateutil.tz
+import httpx
+import openai
+from tenacity import wait_none
 
 # Import the function to test
-from backend.rss_analyzer import analyze_articles
+from backend.rss_analyzer import (
+    analyze_articles,
+    verify_api_key,
+    _build_analysis_row,
+    _ensure_analyses_schema,
+    _parse_percentage,
+    _parse_float,
+)
 
 # Define a fixed UTC time for consistent testing
 MOCK_UTC_NOW = datetime(2024, 4, 9, 23, 30, 0, tzinfo=dateutil.tz.UTC)
@@ -44,8 +54,9 @@ def run_analyze_articles_mocked(mock_dt, mock_verify_key, mock_load_parsers, moc
     # Mock DB connection context manager and cursor
     mock_conn = MagicMock()
     mock_cursor = MagicMock()
-    # Return no articles to stop processing early after the query
-    mock_cursor.fetchall.return_value = []
+    # Report the current schema version, then return no articles to stop processing early after the query
+    mock_cursor.execute.return_value.fetchone.return_value = (1,)
+    mock_cursor.__iter__.return_value = iter([])
     mock_conn.cursor.return_value = mock_cursor
     # Simulate entering the 'with db_connection()' block
     mock_db_conn.return_value.__enter__.return_value = mock_conn
@@ -107,4 +118,177 @@ def test_analyze_articles_uses_previous_day(mock_load_settings, caplog):
 
     assert query_call is not None, "Article query execution not found in mock calls"
     # Check the date parameter used in the WHERE clause
-    assert query_call.args[1][0] == PREVIOUS_DAY_STR 
\ No newline at end of file
+    assert query_call.args[1][0] == PREVIOUS_DAY_STR 
+
+# Test Case 3: Verify sources are analyzed concurrently and saved in order
+@patch('backend.rss_analyzer._load_analysis_settings', return_value="previous_day")
+@patch('backend.rss_analyzer.AIAnalyzer')
+@patch('backend.rss_analyzer.db_connection')
+@patch('backend.rss_analyzer.load_parsers', return_value=['bbc', 'nbc'])
+@patch('backend.rss_analyzer.verify_api_key', return_value=True)
+def test_analyze_articles_runs_sources_concurrently(
+    mock_verify_key, mock_load_parsers, mock_db_conn, mock_ai_analyzer, mock_load_settings, monkeypatch
+):
+    """
+    Verify both sources' AI calls are in flight at the same time, without a cursor
+    crossing threads, and that the successful analyses are saved together.
+    """
+    import threading
+
+    monkeypatch.setenv("INTER_SOURCE_DELAY", "0")
+    monkeypatch.setenv("ANALYSIS_CONCURRENCY", "2")
+    mock_cursor = MagicMock()
+    mock_cursor.execute.return_value.fetchone.return_value = (1,)
+    mock_cursor.__iter__.return_value = iter([
+        (1, "bbc", "A", "2024-04-08 10:00:00"),
+        (2, "nbc", "B", "2024-04-08 11:00:00"),
+    ])
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_db_conn.return_value.__enter__.return_value = mock_conn
+
+    both_started = threading.Barrier(2, timeout=5)
+    contexts = []
+
+    def fake_analyze(context, source_name):
+        contexts.append(context)
+        both_started.wait()  # Fails with BrokenBarrierError if calls ran one at a time
+        return {"numbers_of_articles": "1"}
+
+    mock_ai_analyzer.return_value.analyze_articles.side_effect = fake_analyze
+    analyze_articles()
+
+    assert sorted(c["source"] for c in contexts) == ["bbc", "nbc"]
+    assert all("cursor" not in c for c in contexts)
+    # Both rows are saved with one executemany in a single transaction
+    mock_cursor.executemany.assert_called_once()
+    insert_sql, rows = mock_cursor.executemany.call_args.args
+    assert "INSERT OR REPLACE INTO analyses" in insert_sql
+    assert [row[1] for row in rows] == [1, 2]
+    # Ids depend only on source and day, so a rerun replaces rather than duplicates
+    import hashlib
+    assert rows[0][0] == hashlib.sha1(f"1|{rows[0][2]}".encode()).hexdigest()
+    assert mock_conn.__exit__.call_count == 1
+
+
+# Test Case 3b: Verify analyses are committed in batches as sources finish
+@patch('backend.rss_analyzer.SAVE_BATCH_SIZE', 2)
+@patch('backend.rss_analyzer._load_analysis_settings', return_value="previous_day")
+@patch('backend.rss_analyzer.AIAnalyzer')
+@patch('backend.rss_analyzer.db_connection')
+@patch('backend.rss_analyzer.load_parsers', return_value=['bbc', 'dw', 'nbc'])
+@patch('backend.rss_analyzer.verify_api_key', return_value=True)
+def test_analyze_articles_saves_in_batches(
+    mock_verify_key, mock_load_parsers, mock_db_conn, mock_ai_analyzer, mock_load_settings, monkeypatch
+):
+    """
+    Verify finished analyses are committed every SAVE_BATCH_SIZE sources, with the
+    remainder saved at the end, so an interrupted run keeps the completed batches.
+    """
+    monkeypatch.setenv("INTER_SOURCE_DELAY", "0")
+    mock_cursor = MagicMock()
+    mock_cursor.execute.return_value.fetchone.return_value = (1,)
+    mock_cursor.__iter__.return_value = iter([
+        (1, "bbc", "A", "2024-04-08 10:00:00"),
+        (2, "dw", "B", "2024-04-08 11:00:00"),
+        (3, "nbc", "C", "2024-04-08 12:00:00"),
+    ])
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    mock_db_conn.return_value.__enter__.return_value = mock_conn
+    mock_ai_analyzer.return_value.analyze_articles.return_value = {"numbers_of_articles": "1"}
+
+    analyze_articles()
+
+    batches = [c.args[1] for c in mock_cursor.executemany.call_args_list]
+    assert [[row[1] for row in rows] for rows in batches] == [[1, 2], [3]]
+    assert mock_conn.__exit__.call_count == 2
+
+
+# Test Case 4: Verify analyzer log records are buffered until an error or flush
+def test_analyzer_log_is_buffered():
+    """
+    Verify INFO records wait in the memory handler while ERROR records flush to the file.
+    """
+    from backend.rss_analyzer import logger, memory_handler, file_handler
+
+    assert memory_handler in logger.handlers and memory_handler.target is file_handler
+    memory_handler.flush()
+    with patch.object(file_handler, "emit") as mock_emit:
+        logger.info("buffered")
+        mock_emit.assert_not_called()
+        logger.error("flushed")
+        assert [r.getMessage() for r in (c.args[0] for c in mock_emit.call_args_list)] == ["buffered", "flushed"]
+
+
+@pytest.mark.parametrize(
+    "parser, value, expected",
+    [
+        (_parse_percentage, "45%", 45.0),
+        (_parse_percentage, " 12.5 % ", 12.5),
+        (_parse_percentage, None, 0.0),
+        (_parse_percentage, "n/a", 0.0),
+        (_parse_float, "-1.5", -1.5),
+        (_parse_float, "", 0.0),
+    ],
+)
+def test_numeric_field_parsers(parser, value, expected):
+    """Test that the numeric field parsers fall back to 0.0 on unparseable input."""
+    assert parser(value, "field") == expected
+
+
+@pytest.mark.parametrize(
+    "error_cls, status, expected_calls",
+    [
+        (openai.AuthenticationError, 401, 1),
+        (openai.RateLimitError, 429, 3),
+    ],
+)
+def test_verify_api_key_retries_only_transient_errors(error_cls, status, expected_calls):
+    """Test that a bad key fails fast while rate limits are retried until the attempts run out."""
+    request = httpx.Request("GET", "https://api.deepseek.com/v1/models")
+    error = error_cls("failed", response=httpx.Response(status, request=request), body=None)
+    with patch("backend.rss_analyzer.OpenAI") as mock_openai, \
+            patch.object(verify_api_key.retry, "wait", wait_none()):
+        mock_list = mock_openai.return_value.models.list
+        mock_list.side_effect = error
+        assert verify_api_key("key") is False
+    assert mock_list.call_count == expected_calls
+
+
+def test_ensure_analyses_schema_runs_ddl_once(temp_db):
+    """Test that the analyses DDL runs on a new database and is skipped once user_version is set."""
+    import sqlite3
+
+    conn = sqlite3.connect(temp_db)
+    try:
+        cursor = conn.cursor()
+        _ensure_analyses_schema(cursor)
+        assert cursor.execute("PRAGMA user_version").fetchone()[0] == 1
+        assert cursor.execute("SELECT name FROM sqlite_master WHERE name = 'analyses'").fetchone()
+
+        with patch("backend.rss_analyzer._CREATE_ANALYSES_SQL", "not valid sql"):
+            _ensure_analyses_schema(cursor) # Would raise if the DDL ran again
+    finally:
+        conn.close()
+
+
+def test_build_analysis_row_matches_insert_columns():
+    """Test that the INSERT row has one value per column with numeric fields parsed."""
+    from backend.rss_analyzer import _ANALYSIS_INSERT_COLUMNS
+
+    result = {
+        "numbers_of_articles": "7",
+        "main_narrative_theme_1": "Conflict",
+        "main_narrative_coverage_1": "40%",
+        "bias_political_score": "-1.5",
+    }
+    row = dict(zip(_ANALYSIS_INSERT_COLUMNS, _build_analysis_row(result, 3, "2024-04-08", 9)))
+    assert len(row) == len(_ANALYSIS_INSERT_COLUMNS)
+    assert row["source_id"] == 3
+    assert row["numbers_of_articles"] == 7
+    assert row["main_narrative_theme_1"] == "Conflict"
+    assert row["main_narrative_coverage_1"] == 40.0
+    assert row["bias_political_score"] == -1.5
+    assert row["sentiment_confidence"] == 0.0 # Missing numeric fields default to 0.0
+    assert row["bias_political_leaning"] is None
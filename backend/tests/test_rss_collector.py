@@ -0,0 +1,117 @@
+# backend/tests/test_rss_collector.py
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from backend.rss_collector import collect_articles
+from backend.src.news_utils import clean_article, db_connection, init_database
+
+
+class FakeParser:
+    """Minimal stand-in for a BaseParser subclass, returning a fixed article list."""
+
+    def __init__(self, source_name, articles, barrier=None):
+        self.source_name = source_name
+        self.feeds = {"world": f"http://{source_name}.example.com/rss"}
+        self.articles = []
+        self._fixed_articles = articles
+        self._barrier = barrier
+
+    def run(self):
+        if self._barrier is not None:
+            self._barrier.wait()  # Raises BrokenBarrierError if sources are fetched one at a time
+        self.articles = list(self._fixed_articles)
+
+    def parse(self):
+        return self.articles
+
+
+def _article(title, feed_url):
+    """Builds a raw article dict shaped like the parsers' output."""
+    return {
+        "title": title,
+        "description": f"{title} description",
+        "link": f"http://example.com/{title}",
+        "publication_date": "2025-02-23 14:58:00",
+        "categories": [],
+        "feed_url": feed_url,
+    }
+
+
+@pytest.fixture
+def collector_db(temp_db):
+    """Fixture pointing the collector's database helpers at a temporary database."""
+    with patch(
+        "backend.rss_collector.init_database", lambda: init_database(temp_db)
+    ), patch(
+        "backend.rss_collector.db_connection",
+        lambda **kwargs: db_connection(temp_db, **kwargs),
+    ):
+        yield temp_db
+
+
+def test_collect_articles_fetches_sources_concurrently(collector_db):
+    """Test that sources are fetched in parallel and each one's articles are saved."""
+    barrier = threading.Barrier(2, timeout=5)
+    parsers = [
+        FakeParser("bbc", [_article("a", "http://bbc.example.com/rss")], barrier),
+        FakeParser(
+            "nbc",
+            [_article("b", "http://nbc.example.com/rss"), _article("c", "http://nbc.example.com/rss")],
+            barrier,
+        ),
+        FakeParser("unknown_source", [_article("d", "http://x.example.com/rss")]),
+    ]
+    media_sources = {"bbc", "nbc"}
+
+    with patch("backend.rss_collector.load_parsers", return_value=parsers), patch(
+        "backend.rss_collector.get_media_source_names", return_value=media_sources
+    ) as mock_get_media:
+        result = collect_articles()
+
+    # media_sources is read once per run, not once per parser
+    mock_get_media.assert_called_once()
+
+    # The source missing from media_sources is never fetched
+    assert result == {"bbc": 1, "nbc": 2}
+    with db_connection(collector_db) as conn:
+        rows = conn.execute(
+            "SELECT s.name, a.categories FROM articles a JOIN sources s ON a.source_id = s.source_id"
+        ).fetchall()
+    assert sorted(tuple(row) for row in rows) == [("bbc", "world"), ("nbc", "world"), ("nbc", "world")]
+
+
+def test_collect_articles_inserts_in_batches(collector_db):
+    """Test that articles are saved across several executemany() batches without losing rows."""
+    feed_url = "http://bbc.example.com/rss"
+    parser = FakeParser("bbc", [_article(f"t{i}", feed_url) for i in range(5)])
+
+    with patch("backend.rss_collector.load_parsers", return_value=[parser]), patch(
+        "backend.rss_collector.get_media_source_names", return_value={"bbc"}
+    ), patch("backend.rss_collector.INSERT_BATCH_SIZE", 2):
+        result = collect_articles()
+
+    assert result == {"bbc": 5}
+    with db_connection(collector_db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 5
+
+
+def test_collect_articles_skips_saved_articles(collector_db):
+    """Test that a rerun only cleans and counts articles that aren't stored yet."""
+    feed_url = "http://bbc.example.com/rss"
+    first_run = [_article("a", feed_url), _article("b", feed_url)]
+    second_run = first_run + [_article("c", feed_url)]
+    media_sources = {"bbc"}
+
+    with patch("backend.rss_collector.get_media_source_names", return_value=media_sources):
+        with patch("backend.rss_collector.load_parsers", return_value=[FakeParser("bbc", first_run)]):
+            assert collect_articles() == {"bbc": 2}
+        with patch(
+            "backend.rss_collector.load_parsers", return_value=[FakeParser("bbc", second_run)]
+        ), patch("backend.rss_collector.clean_article", wraps=clean_article) as mock_clean:
+            assert collect_articles() == {"bbc": 1}
+
+    assert mock_clean.call_count == 1
+    with db_connection(collector_db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0] == 3
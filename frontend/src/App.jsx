@@ -30,9 +30,10 @@ function App() {
   useEffect(() => {
     if (selectedSource) {
       setIsLoading(true);
-      axios.get(`${API_URL}/analyses`, { params: { source: selectedSource.source } })
+      axios.get(`${API_URL}/analyses`, { params: { source: selectedSource.source, layout: 'columns' } })
         .then(response => {
-          setAnalyses(response.data);
+          const { columns, rows } = response.data;
+          setAnalyses(rows.map(row => Object.fromEntries(columns.map((column, i) => [column, row[i]]))));
         })
         .catch(error => {
           console.error('Error fetching analyses for source:', error);